@@ -3,6 +3,7 @@
 PyInstaller spec file for Document Summarizer
 Native desktop application with CustomTkinter GUI
 """
+import os
 import sys
 from PyInstaller.utils.hooks import collect_data_files, collect_submodules
 
@@ -20,10 +21,19 @@ hiddenimports = [
     'google.generativeai',
     'customtkinter',
     'tkinterdnd2',
+    'keyring.backends.Windows',
 ]
 hiddenimports += collect_submodules('customtkinter')
 hiddenimports += collect_submodules('tkinterdnd2')
 
+# Modules compiled by setup_cython.py are extension modules PyInstaller cannot
+# scan, so list the imports they make
+if os.environ.get('CYTHONIZE') == '1':
+    hiddenimports += [
+        'orjson', 'keyring', 'sqlite3', 'httpx', 'h2', 'tiktoken', 'tiktoken_ext.openai_public',
+        'openai', 'anthropic',
+    ]
+
 a = Analysis(
     ['native_app.py'],
     pathex=[],
@@ -42,20 +52,18 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-dir build: binaries and data sit next to the exe instead of being
+# unpacked to a temp folder on every launch (the installer extracts them once)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='DocumentSummarizer',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,  # No console window
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -65,3 +73,14 @@ exe = EXE(
     icon='icon.ico',  # Application icon
     version_file=None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='DocumentSummarizer',
+)
@@ -2,8 +2,369 @@
 AI Provider abstraction layer for multiple AI services
 Supports: Gemini, ChatGPT, Claude, Groq, Grok
 """
+import asyncio
+import atexit
+import hashlib
+import importlib
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Optional, Dict, Iterator, List, AsyncIterable
+
+
+class _SummaryCache:
+    """Persistent exact-match cache of summaries, stored in SQLite
+
+    Writes are handed to a background thread that commits them in batches,
+    so callers never wait on disk I/O. Entries expire after TTL_SECONDS.
+    """
+
+    BATCH_SIZE = 64
+    TTL_SECONDS = 30 * 86400
+
+    def __init__(self, path: str = None):
+        self._path = path
+        self._conn = None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, str] = {}  # written by set() but not yet committed
+        self._queue = queue.Queue()
+        self._writer = None
+
+    def _get_conn(self):
+        """Open the cache database on first use"""
+        if self._conn is None:
+            if self._path is None:
+                from api_manager import get_config_dir
+                self._path = os.path.join(get_config_dir(), 'cache.db')
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS c (k TEXT PRIMARY KEY, result TEXT NOT NULL)")
+            try:
+                # Caches created before expiry existed lack the column; their rows count as expired
+                conn.execute("ALTER TABLE c ADD COLUMN created REAL NOT NULL DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass
+            conn.execute("DELETE FROM c WHERE created < ?", (time.time() - self.TTL_SECONDS,))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(provider_name: str, model: str, text: str) -> str:
+        """Build the cache key for a provider/model/prompt/text combination
+
+        Runs of spaces and tabs are collapsed, so the same text extracted from a PDF
+        and a DOCX shares one entry; line and paragraph breaks are kept.
+        """
+        normalized = _HORIZONTAL_SPACE.sub(" ", text)
+        return hashlib.blake2b(f"{provider_name}|{model}|{_PROMPT_FINGERPRINT}|{normalized}".encode(),
+                               digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached summary for a key, or None on a miss"""
+        try:
+            with self._lock:
+                if key in self._pending:
+                    return self._pending[key]
+                row = self._get_conn().execute("SELECT result FROM c WHERE k=? AND created >= ?",
+                                               (key, time.time() - self.TTL_SECONDS)).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, result: str):
+        """Queue a summary to be stored under the given key"""
+        with self._lock:
+            self._pending[key] = result
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, daemon=True)
+                self._writer.start()
+                atexit.register(self.flush)
+        self._queue.put((key, result, time.time()))
+
+    def flush(self):
+        """Block until every queued write has been committed"""
+        self._queue.join()
+
+    def _write_loop(self):
+        """Commit queued writes, up to BATCH_SIZE per transaction"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._lock:
+                    conn = self._get_conn()
+                    conn.executemany("INSERT OR REPLACE INTO c (k, result, created) VALUES (?, ?, ?)", batch)
+                    conn.commit()
+            except sqlite3.Error:
+                pass
+            with self._lock:
+                for key, result, _ in batch:
+                    if self._pending.get(key) is result:
+                        del self._pending[key]
+            for _ in batch:
+                self._queue.task_done()
+
+
+class _SemanticCache:
+    """Near-duplicate summary cache using sentence embeddings and a FAISS index
+
+    Opt-in: used only by providers with a SEMANTIC_CACHE_THRESHOLD, and only when
+    sentence-transformers and faiss are installed.
+    """
+
+    MODEL_NAME = "all-MiniLM-L6-v2"
+    # The document is embedded as the mean of evenly spaced windows, so a shared
+    # cover page or letterhead cannot dominate the vector
+    WINDOW_CHARS = 1000  # about the encoder's 256-token input limit
+    SAMPLE_WINDOWS = 8
+    SEARCH_K = 8
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._available = False
+        self._faiss = None
+        self._encoder = None
+        self._index = None
+        self._entries: List[List[str]] = []  # vector id -> [scope, summary]
+        self._index_path = None
+        self._entries_path = None
+
+    def _load(self) -> bool:
+        """Import the embedding stack and load the index on first use"""
+        if self._loaded:
+            return self._available
+        self._loaded = True
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            return False
+
+        from api_manager import get_config_dir
+        config_dir = get_config_dir()
+        self._index_path = os.path.join(config_dir, 'sem_cache_v2.faiss')
+        self._entries_path = os.path.join(config_dir, 'sem_cache_v2.json')
+
+        self._faiss = faiss
+        self._encoder = SentenceTransformer(self.MODEL_NAME)
+        try:
+            self._index = faiss.read_index(self._index_path)
+            with open(self._entries_path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+            if self._index.ntotal != len(self._entries):
+                raise ValueError("semantic cache index and entries are out of sync")
+        except Exception:
+            self._index = faiss.IndexFlatIP(self._encoder.get_sentence_embedding_dimension())
+            self._entries = []
+        self._available = True
+        return True
+
+    def _sample(self, text: str) -> List[str]:
+        """Windows spread over the head, middle and tail of the text"""
+        size = self.WINDOW_CHARS
+        count = self.SAMPLE_WINDOWS
+        if len(text) <= size * count:
+            return [text[i:i + size] for i in range(0, len(text), size)] or [text]
+        last = len(text) - size
+        return [text[start:start + size] for start in (last * i // (count - 1) for i in range(count))]
+
+    def embed(self, text: str):
+        """Return the L2-normalized embedding of the text, or None if disabled"""
+        with self._lock:
+            if not self._load():
+                return None
+            vecs = self._encoder.encode(self._sample(text), normalize_embeddings=True)
+        vec = vecs.mean(axis=0, keepdims=True)
+        vec /= max(float((vec ** 2).sum()) ** 0.5, 1e-12)
+        return vec.astype('float32')
+
+    def lookup(self, scope: str, vec, threshold: float) -> Optional[str]:
+        """Return a stored summary whose embedding is within the threshold"""
+        with self._lock:
+            if not self._index.ntotal:
+                return None
+            scores, ids = self._index.search(vec, min(self.SEARCH_K, self._index.ntotal))
+            for score, idx in zip(scores[0], ids[0]):
+                if idx < 0 or score < threshold:
+                    break
+                entry_scope, summary = self._entries[idx]
+                if entry_scope == scope:
+                    return summary
+        return None
+
+    def add(self, scope: str, vec, summary: str):
+        """Store a summary under the given embedding and persist the index"""
+        with self._lock:
+            self._index.add(vec)
+            self._entries.append([scope, summary])
+            try:
+                self._faiss.write_index(self._index, self._index_path)
+                with open(self._entries_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f)
+            except Exception:
+                pass
+
+
+class RateLimiter:
+    """Token-bucket limiter for requests per minute and tokens per minute"""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_requests = float(rpm)
+        self.available_tokens = float(tpm)
+        self.last_update_ts = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Refill both buckets and take capacity; return seconds to wait if there is not enough"""
+        tokens = min(tokens, self.tpm)
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_update_ts
+            self.last_update_ts = now
+            self.available_requests = min(self.rpm, self.available_requests + elapsed * self.rpm / 60)
+            self.available_tokens = min(self.tpm, self.available_tokens + elapsed * self.tpm / 60)
+
+            if self.available_requests >= 1 and self.available_tokens >= tokens:
+                self.available_requests -= 1
+                self.available_tokens -= tokens
+                return 0.0
+
+            wait_requests = (1 - self.available_requests) * 60 / self.rpm
+            wait_tokens = (tokens - self.available_tokens) * 60 / self.tpm
+            return max(wait_requests, wait_tokens, 0.01)
+
+    def acquire(self, tokens: int = 0):
+        """Block until a request of the given token size may be sent"""
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0):
+        """Async variant of acquire() that yields to the event loop while waiting"""
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+_CACHE = _SummaryCache()
+_SEMANTIC_CACHE = _SemanticCache()
+_LIMITERS: Dict[tuple, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+_INFLIGHT: Dict[str, Future] = {}  # cache key -> result of the call already running for it
+_INFLIGHT_LOCK = threading.Lock()
+
+HTTP_TIMEOUT = 120.0
+HTTP_MAX_CONNECTIONS = 32
+_SHARED_HTTPX = None
+_SHARED_HTTPX_LOCK = threading.Lock()
+
+
+def _httpx_kwargs() -> Dict:
+    """Connection settings for the shared pool"""
+    import httpx
+    try:
+        import h2  # noqa: F401  HTTP/2 needs the optional h2 package
+        http2 = True
+    except ImportError:
+        http2 = False
+    limits = httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                          max_keepalive_connections=HTTP_MAX_CONNECTIONS)
+    return {"http2": http2, "timeout": HTTP_TIMEOUT, "limits": limits}
+
+
+def _shared_http_client():
+    """Keep-alive HTTP client shared by every provider SDK that accepts one
+
+    Async callers use it too, from a worker thread (see _asummarize_uncached): Flask
+    runs each async view on a new event loop, so a per-loop AsyncClient would never
+    reuse a connection and would be left open when its loop ended.
+    """
+    global _SHARED_HTTPX
+    if _SHARED_HTTPX is None:
+        with _SHARED_HTTPX_LOCK:
+            if _SHARED_HTTPX is None:
+                import httpx
+                _SHARED_HTTPX = httpx.Client(**_httpx_kwargs())
+    return _SHARED_HTTPX
+
+
+SYSTEM_PROMPT = ("You are a helpful assistant that creates clear, concise summaries of documents. "
+                 "Provide a well-structured summary with key points and main ideas.")
+SUMMARY_REQUEST = "Please provide a comprehensive summary of the following text:"
+# Built once so the document is never copied into a larger prompt string
+PROMPT_PREFIX = f"{SYSTEM_PROMPT}\n\n{SUMMARY_REQUEST}\n\n"
+CHAT_SYSTEM_PROMPT = f"{SYSTEM_PROMPT}\n\n{SUMMARY_REQUEST}"
+TRUNCATION_NOTE = "\n\n[Text truncated due to length...]"
+SECTION_HEADER = "[Section {index} of {total} of a longer document]\n\n"
+# Used when sections are sent before the end of the document is known
+OPEN_SECTION_HEADER = "[Section {index} of a longer document]\n\n"
+REDUCE_HEADER = ("[The following are summaries of consecutive sections of one document. "
+                 "Combine them into a single summary of the whole document.]\n\n")
+PACKED_REQUEST = ('Summarize each document below independently. '
+                  'Return JSON: {"1": "...", "2": "..."} with one summary per document number.')
+# Part of every cache key, so editing a prompt never serves summaries made with the old one
+_PROMPT_FINGERPRINT = hashlib.blake2b("\0".join((
+    SYSTEM_PROMPT, SUMMARY_REQUEST, TRUNCATION_NOTE, SECTION_HEADER,
+    OPEN_SECTION_HEADER, REDUCE_HEADER, PACKED_REQUEST)).encode(), digest_size=8).hexdigest()
+_HORIZONTAL_SPACE = re.compile(r"[^\S\r\n]+")
+
+_ENCODINGS: Dict[Optional[str], object] = {}  # model (None = cl100k_base) -> encoding
+
+
+def _get_encoding(model: str = None):
+    """Get the tiktoken encoding for a model (cl100k_base by default), or None if unavailable"""
+    if model not in _ENCODINGS:
+        try:
+            import tiktoken
+            if model is None:
+                enc = tiktoken.get_encoding("cl100k_base")
+            else:
+                try:
+                    enc = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    # Not an OpenAI model; cl100k_base is a close approximation
+                    enc = _get_encoding()
+        except Exception:
+            # Not installed, or the BPE file could not be downloaded (offline)
+            enc = None
+        _ENCODINGS[model] = enc
+    return _ENCODINGS[model]
+
+
+def chunk_text(text: str, max_tokens: int, overlap: int = 200) -> List[str]:
+    """Split text into chunks of at most max_tokens tokens that overlap by `overlap` tokens"""
+    step = max_tokens - overlap
+    enc = _get_encoding()
+    if enc is None:
+        # Without a tokenizer assume ~4 characters per token
+        size = max_tokens * 4
+        if len(text) <= size:
+            return [text]
+        return [text[i:i + size] for i in range(0, len(text) - overlap * 4, step * 4)]
+
+    ids = enc.encode(text, disallowed_special=())
+    if len(ids) <= max_tokens:
+        return [text]
+    return [enc.decode(ids[i:i + max_tokens]) for i in range(0, len(ids) - overlap, step)]
 
 
 class AIProvider(ABC):
@@ -16,16 +377,340 @@ class AIProvider(ABC):
     DEFAULT_MODEL = ""
     API_KEY_URL = ""
     API_KEY_HELP = ""
+    MAX_CHARS = 100000  # Character budget for packing and when no tokenizer is available
+    TOKEN_LIMIT = 25_000  # Input is truncated beyond this many tokens
+    # Default published tier limits, used to throttle requests before the API returns 429
+    RATE_LIMIT_RPM = 60
+    RATE_LIMIT_TPM = 100000
+    # Chunk size for summarize_long(); keep chunks comfortably under TOKEN_LIMIT
+    CHUNK_TOKENS = 20000
+    # Documents per request in summarize_many(); 1 means one request per document
+    PACK_SIZE = 1
+    # Cosine similarity needed to reuse a near-duplicate summary (e.g. 0.92); None,
+    # the default, disables the semantic cache: a near match still serves another
+    # document's summary, so only enable it where that is acceptable
+    SEMANTIC_CACHE_THRESHOLD: Optional[float] = None
+    # Vendor SDK module imported by _get_client(); prewarm_sdks() imports it ahead of time
+    SDK_MODULE = ""
+    # Cheaper, faster model used for tier="fast" drafts; None means no fast tier
+    FAST_MODEL: Optional[str] = None
 
     def __init__(self, api_key: str, model: str = None):
         self.api_key = api_key
         self.model = model or self.DEFAULT_MODEL
+        self._client_lock = threading.Lock()
+
+    @property
+    def _limiter(self) -> RateLimiter:
+        """Rate limiter shared by every instance using the same provider and model"""
+        return self._limiter_for(self.model)
+
+    def _limiter_for(self, model: str) -> RateLimiter:
+        """Rate limiter for one of this provider's models"""
+        limiter_key = (self.PROVIDER_NAME, model)
+        with _LIMITERS_LOCK:
+            limiter = _LIMITERS.get(limiter_key)
+            if limiter is None:
+                limiter = _LIMITERS[limiter_key] = RateLimiter(self.RATE_LIMIT_RPM, self.RATE_LIMIT_TPM)
+        return limiter
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Rough request size: ~4 chars per input token plus room for the response"""
+        return min(len(text), self.MAX_CHARS) // 4 + 2000
+
+    def _truncate_parts(self, text: str) -> List[str]:
+        """Truncate text to the provider's input token limit
+
+        Returns [text], or [truncated_text, TRUNCATION_NOTE] so callers that accept
+        content parts never have to concatenate the document.
+        """
+        # A character is at most 4 UTF-8 bytes, and so at most 4 tokens
+        if len(text) * 4 <= self.TOKEN_LIMIT:
+            return [text]
+        enc = _get_encoding(self.model)
+        if enc is None:
+            if len(text) > self.MAX_CHARS:
+                return [text[:self.MAX_CHARS], TRUNCATION_NOTE]
+            return [text]
+        ids = enc.encode(text, disallowed_special=())
+        if len(ids) > self.TOKEN_LIMIT:
+            return [enc.decode(ids[:self.TOKEN_LIMIT]), TRUNCATION_NOTE]
+        return [text]
+
+    def _truncate(self, text: str) -> str:
+        """Truncate text to the provider's input token limit, as a single string"""
+        # join() hands back the text itself when nothing was cut
+        return "".join(self._truncate_parts(text))
+
+    def _cache_lookup(self, text: str):
+        """Check the exact and semantic caches
+
+        Returns (cached_summary, key, scope, embedding).
+        """
+        key = _CACHE.make_key(self.PROVIDER_NAME, self.model, text)
+        scope = f"{self.PROVIDER_NAME}|{self.model}"
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached, key, scope, None
+
+        vec = None
+        if self.SEMANTIC_CACHE_THRESHOLD is not None:
+            vec = _SEMANTIC_CACHE.embed(text)
+            if vec is not None:
+                similar = _SEMANTIC_CACHE.lookup(scope, vec, self.SEMANTIC_CACHE_THRESHOLD)
+                if similar is not None:
+                    return similar, key, scope, vec
+        return None, key, scope, vec
+
+    def _cache_store(self, key: str, scope: str, vec, result: str):
+        """Store a fresh summary in the exact and semantic caches"""
+        if result:
+            _CACHE.set(key, result)
+            if vec is not None:
+                _SEMANTIC_CACHE.add(scope, vec, result)
+
+    @staticmethod
+    def _claim_inflight(key: str):
+        """Return (future, is_leader); only the leader calls the API for a given key"""
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            if future is not None:
+                return future, False
+            future = _INFLIGHT[key] = Future()
+            return future, True
+
+    @staticmethod
+    def _release_inflight(key: str):
+        """Forget the in-flight call for a key once its result is published"""
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+    def _for_tier(self, tier: str) -> "AIProvider":
+        """Return self for the "quality" tier, or a FAST_MODEL sibling for the "fast" tier"""
+        if tier == "fast" and self.FAST_MODEL and self.FAST_MODEL != self.model:
+            return _make_provider(type(self), self.api_key, self.FAST_MODEL)
+        return self
+
+    def summarize(self, text: str, tier: str = "quality") -> str:
+        """Summarize the given text, reusing a cached or already-running result when available
+
+        tier="fast" drafts the summary with FAST_MODEL; "quality" uses the configured model.
+        """
+        provider = self._for_tier(tier)
+        if provider is not self:
+            return provider.summarize(text)
+
+        cached, key, scope, vec = self._cache_lookup(text)
+        if cached is not None:
+            return cached
+
+        future, leader = self._claim_inflight(key)
+        if not leader:
+            return future.result()
+        try:
+            self._limiter.acquire(self._estimate_tokens(text))
+            result = self._summarize_uncached(text)
+            self._cache_store(key, scope, vec, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._release_inflight(key)
+
+    async def asummarize(self, text: str, tier: str = "quality") -> str:
+        """Async variant of summarize() that does not block the event loop"""
+        provider = self._for_tier(tier)
+        if provider is not self:
+            return await provider.asummarize(text)
+
+        cached, key, scope, vec = await asyncio.to_thread(self._cache_lookup, text)
+        if cached is not None:
+            return cached
+
+        future, leader = self._claim_inflight(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            await self._limiter.aacquire(self._estimate_tokens(text))
+            result = await self._asummarize_uncached(text)
+            await asyncio.to_thread(self._cache_store, key, scope, vec, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._release_inflight(key)
+
+    async def asummarize_batch(self, texts: List[str], max_concurrency: int = 8) -> List[str]:
+        """Summarize several texts concurrently, in input order"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(text):
+            async with semaphore:
+                return await self.asummarize(text)
+
+        return list(await asyncio.gather(*(run(text) for text in texts)))
+
+    async def asummarize_long(self, text: str) -> str:
+        """Summarize a document of any length by map-reducing over token-sized chunks"""
+        chunks = chunk_text(text, self.CHUNK_TOKENS)
+        if len(chunks) == 1:
+            return await self.asummarize(text)
+
+        total = len(chunks)
+        partials = await self.asummarize_batch([
+            SECTION_HEADER.format(index=i, total=total) + chunk
+            for i, chunk in enumerate(chunks, 1)
+        ])
+        return await self._areduce(partials)
+
+    async def _areduce(self, partials: List[str]) -> str:
+        """Combine section summaries into one, recursing while they exceed a chunk"""
+        combined = "\n\n".join(partials)
+        if len(chunk_text(combined, self.CHUNK_TOKENS)) > 1:
+            return await self.asummarize_long(combined)
+        return await self.asummarize(REDUCE_HEADER + combined)
+
+    async def asummarize_pieces(self, pieces: AsyncIterable[str], max_concurrency: int = 8) -> str:
+        """Summarize a document that arrives in pieces (e.g. PDF pages)
+
+        Each chunk is sent as soon as enough text has arrived, so the API calls for
+        early sections overlap with extraction of later ones. A document that turns
+        out to fit one chunk is summarized exactly as asummarize_long() would.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks = []
+
+        async def run(text):
+            async with semaphore:
+                return await self.asummarize(text)
+
+        def launch(chunks):
+            for chunk in chunks:
+                header = OPEN_SECTION_HEADER.format(index=len(tasks) + 1)
+                tasks.append(asyncio.create_task(run(header + chunk)))
+
+        chunk_chars = self.CHUNK_TOKENS * 4
+        buffer: List[str] = []
+        size = 0
+        threshold = chunk_chars
+        try:
+            async for piece in pieces:
+                buffer.append(piece)
+                size += len(piece)
+                if size < threshold:
+                    continue
+                chunks = chunk_text("".join(buffer), self.CHUNK_TOKENS)
+                if len(chunks) > 1:
+                    # The last chunk may still grow; it already overlaps the one before it
+                    launch(chunks[:-1])
+                    buffer = [chunks[-1]]
+                    size = len(chunks[-1])
+                    threshold = chunk_chars
+                else:
+                    # Token-sparse text: wait for more before re-tokenizing
+                    threshold = size + chunk_chars // 4
+
+            text = "".join(buffer)
+            if not tasks:
+                return await self.asummarize_long(text)
+            launch(chunk_text(text, self.CHUNK_TOKENS))
+            partials = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return await self._areduce(list(partials))
+
+    def summarize_long(self, text: str) -> str:
+        """Blocking wrapper around asummarize_long() for callers without an event loop"""
+        return asyncio.run(self.asummarize_long(text))
+
+    def summarize_many(self, texts: List[str]) -> List[str]:
+        """Summarize several documents, packing short ones into shared requests"""
+        results: List[Optional[str]] = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            cached, key, scope, vec = self._cache_lookup(text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, text, key, scope, vec))
+
+        for group in self._pack_groups(pending):
+            group_texts = [item[1] for item in group]
+            self._limiter.acquire(min(sum(map(len, group_texts)), self.MAX_CHARS) // 4 + 2000)
+            if len(group) > 1:
+                summaries = self._summarize_packed_uncached(group_texts)
+            else:
+                summaries = [self._summarize_uncached(group_texts[0])]
+
+            for (i, text, key, scope, vec), summary in zip(group, summaries):
+                if not summary:
+                    # The packed response skipped this document; retry it through the
+                    # rate limiter and in-flight coalescing like any other request
+                    results[i] = self.summarize(text)
+                    continue
+                self._cache_store(key, scope, vec, summary)
+                results[i] = summary
+        return results
+
+    def _pack_groups(self, pending: list) -> list:
+        """Group documents so each request holds at most PACK_SIZE docs and MAX_CHARS chars"""
+        groups = []
+        group = []
+        group_chars = 0
+        for item in pending:
+            size = len(item[1])
+            if group and (len(group) >= self.PACK_SIZE or group_chars + size > self.MAX_CHARS):
+                groups.append(group)
+                group = []
+                group_chars = 0
+            group.append(item)
+            group_chars += size
+        if group:
+            groups.append(group)
+        return groups
+
+    def _summarize_packed_uncached(self, texts: List[str]) -> List[Optional[str]]:
+        """Summarize several documents in one API call; None marks a missing summary"""
+        return [self._summarize_uncached(text) for text in texts]
+
+    def stream_summarize(self, text: str, tier: str = "quality") -> Iterator[str]:
+        """Yield the summary in pieces as the provider generates it"""
+        provider = self._for_tier(tier)
+        if provider is not self:
+            yield from provider.stream_summarize(text)
+            return
+
+        cached, key, scope, vec = self._cache_lookup(text)
+        if cached is not None:
+            yield cached
+            return
+
+        self._limiter.acquire(self._estimate_tokens(text))
+        parts = []
+        for part in self._stream_uncached(text):
+            parts.append(part)
+            yield part
+        self._cache_store(key, scope, vec, "".join(parts))
+
+    def _summarize_uncached(self, text: str) -> str:
+        """Summarize the given text by calling the provider API"""
+        return "".join(self._stream_uncached(text))
 
     @abstractmethod
-    def summarize(self, text: str) -> str:
-        """Summarize the given text"""
+    def _stream_uncached(self, text: str) -> Iterator[str]:
+        """Stream a summary of the given text from the provider API"""
         pass
 
+    async def _asummarize_uncached(self, text: str) -> str:
+        """Async API call: the blocking call runs in a thread on the shared connection pool"""
+        return await asyncio.to_thread(self._summarize_uncached, text)
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test if the API key is valid"""
@@ -41,6 +726,7 @@ class GeminiProvider(AIProvider):
     """Google Gemini AI provider"""
 
     PROVIDER_NAME = "gemini"
+    SDK_MODULE = "google.generativeai"
     DISPLAY_NAME = "Google Gemini"
     MODELS = {
         "gemini-2.5-pro": "Gemini 2.5 Pro (Best Quality)",
@@ -52,104 +738,254 @@ class GeminiProvider(AIProvider):
     DEFAULT_MODEL = "gemini-2.5-pro"
     API_KEY_URL = "https://aistudio.google.com/app/apikey"
     API_KEY_HELP = "Get your free API key from Google AI Studio"
+    MAX_CHARS = 500000
+    TOKEN_LIMIT = 125_000
+    CHUNK_TOKENS = 100_000
+    RATE_LIMIT_RPM = 15
+    RATE_LIMIT_TPM = 1000000
+    FAST_MODEL = "gemini-2.5-flash"
+    FALLBACK_MODEL = "gemini-2.5-flash"
+    # Opt-in: race FALLBACK_MODEL against the configured model and keep the first
+    # success. Flash nearly always wins, so this trades the configured model's output
+    # (and pays for a second generation) for latency. By default the fallback is
+    # only tried after the configured model fails.
+    SPECULATIVE_FALLBACK = False
 
     def __init__(self, api_key: str, model: str = None):
         super().__init__(api_key, model)
-        self._genai = None
+        self._model_obj = None
+
+    def _get_model(self):
+        """Get the GenerativeModel, built once and bound to this provider's API key
+
+        genai.configure() sets one process-wide key, so a connection test with another
+        key would re-point every cached provider; the model gets its own service client
+        instead and the global configuration is never touched.
+        """
+        if self._model_obj is None:
+            with self._client_lock:
+                if self._model_obj is None:
+                    import google.generativeai as genai
+                    from google.ai import generativelanguage as glm
+                    model_obj = genai.GenerativeModel(self.model)
+                    # generate_content() only falls back to the configured default
+                    # client when the model has none of its own
+                    model_obj._client = glm.GenerativeServiceClient(
+                        client_options={"api_key": self.api_key})
+                    self._model_obj = model_obj
+        return self._model_obj
 
-    def _get_genai(self):
-        """Get configured genai module"""
-        if self._genai is None:
-            import google.generativeai as genai
-            genai.configure(api_key=self.api_key)
-            self._genai = genai
-        return self._genai
+    def _fallback(self) -> Optional["GeminiProvider"]:
+        """Provider for FALLBACK_MODEL, or None when that is the configured model
 
-    def summarize(self, text: str) -> str:
-        """Summarize text using Gemini"""
-        max_chars = 500000
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n\n[Text truncated due to length...]"
+        It has its own cache keys and rate limiter, so a fallback summary is never
+        stored as the configured model's.
+        """
+        if self.FALLBACK_MODEL and self.FALLBACK_MODEL != self.model:
+            return _make_provider(type(self), self.api_key, self.FALLBACK_MODEL)
+        return None
 
-        prompt = f"""You are a helpful assistant that creates clear, concise summaries of documents.
-Provide a well-structured summary with key points and main ideas.
+    def _build_prompt(self, text: str) -> List[Dict]:
+        """Build the prompt as content parts so the document is passed through as-is"""
+        return [{"role": "user", "parts": [PROMPT_PREFIX, *self._truncate_parts(text)]}]
 
-Please provide a comprehensive summary of the following text:
+    def _stream_uncached(self, text: str) -> Iterator[str]:
+        """Stream a summary from Gemini"""
+        prompt = self._build_prompt(text)
+        try:
+            model = self._get_model()
+            for chunk in model.generate_content(prompt, stream=True):
+                yield chunk.text
+        except Exception as e:
+            raise Exception(f"Gemini API error: {str(e)}")
 
-{text}"""
+    def _summarize_uncached(self, text: str) -> str:
+        """Summarize text with Gemini
 
+        Async callers run this on a thread (the inherited _asummarize_uncached):
+        generate_content_async() binds its gRPC channel to the first event loop that
+        uses the model, which breaks callers that start a new loop per request
+        (Flask async views, asyncio.run).
+        """
         try:
-            genai = self._get_genai()
-            model = genai.GenerativeModel(self.model)
-            response = model.generate_content(prompt)
-            return response.text
+            return self._get_model().generate_content(self._build_prompt(text)).text
         except Exception as e:
             raise Exception(f"Gemini API error: {str(e)}")
 
+    def summarize(self, text: str, tier: str = "quality") -> str:
+        """Summarize with the configured model, falling back to FALLBACK_MODEL"""
+        provider = self._for_tier(tier)
+        if provider is not self:
+            return provider.summarize(text)
+        fallback = self._fallback()
+        if fallback is None:
+            return super().summarize(text)
+        if not self.SPECULATIVE_FALLBACK:
+            try:
+                return super().summarize(text)
+            except Exception:
+                return fallback.summarize(text)
+
+        pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            error = None
+            for future in as_completed([pool.submit(super().summarize, text),
+                                        pool.submit(fallback.summarize, text)]):
+                try:
+                    return future.result()
+                except Exception as e:
+                    error = e
+            raise error
+        finally:
+            # The losing request finishes in its thread and caches its own result
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def asummarize(self, text: str, tier: str = "quality") -> str:
+        """Async variant of summarize()"""
+        provider = self._for_tier(tier)
+        if provider is not self:
+            return await provider.asummarize(text)
+        fallback = self._fallback()
+        if fallback is None:
+            return await super().asummarize(text)
+        if self.SPECULATIVE_FALLBACK:
+            # Race on threads: cancelling the losing task would fail any caller
+            # coalesced onto its in-flight request
+            return await asyncio.to_thread(self.summarize, text)
+        try:
+            return await super().asummarize(text)
+        except Exception:
+            return await fallback.asummarize(text)
+
+    def stream_summarize(self, text: str, tier: str = "quality") -> Iterator[str]:
+        """Stream a summary, switching to FALLBACK_MODEL if the configured model fails before any output"""
+        provider = self._for_tier(tier)
+        if provider is not self:
+            yield from provider.stream_summarize(text)
+            return
+        fallback = self._fallback()
+        started = False
+        try:
+            for part in super().stream_summarize(text):
+                started = True
+                yield part
+        except Exception:
+            if started or fallback is None:
+                raise
+            yield from fallback.stream_summarize(text)
+
     def test_connection(self) -> bool:
         """Test if the API key is valid"""
         try:
-            genai = self._get_genai()
-            model = genai.GenerativeModel(self.model)
+            model = self._get_model()
             response = model.generate_content("Say 'OK' if you can read this.")
             return bool(response.text)
         except:
             return False
 
 
-class OpenAIProvider(AIProvider):
-    """OpenAI ChatGPT provider"""
+def _chat_messages(text: str) -> List[Dict[str, str]]:
+    """Build system + user messages for chat-completion style APIs"""
+    return [
+        {"role": "system", "content": CHAT_SYSTEM_PROMPT},
+        {"role": "user", "content": text},
+    ]
+
+
+def _packed_messages(texts: List[str]) -> List[Dict[str, str]]:
+    """Build chat messages asking for one JSON-keyed summary per numbered document"""
+    system = f"{SYSTEM_PROMPT} {PACKED_REQUEST}"
+    body = "".join(f"\n\n===DOC {i}===\n{text}" for i, text in enumerate(texts, 1))
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": body},
+    ]
 
-    PROVIDER_NAME = "openai"
-    DISPLAY_NAME = "OpenAI (ChatGPT)"
-    MODELS = {
-        "gpt-4o": "GPT-4o (Best Quality)",
-        "gpt-4o-mini": "GPT-4o Mini (Fast & Cheap)",
-        "gpt-4-turbo": "GPT-4 Turbo",
-        "gpt-4": "GPT-4",
-        "gpt-3.5-turbo": "GPT-3.5 Turbo (Budget)",
-    }
-    DEFAULT_MODEL = "gpt-4o"
-    API_KEY_URL = "https://platform.openai.com/api-keys"
-    API_KEY_HELP = "Get your API key from OpenAI Platform"
+
+def _parse_packed(content: str, count: int) -> List[Optional[str]]:
+    """Parse a packed JSON response; documents missing from it come back as None"""
+    try:
+        data = json.loads(content)
+    except (TypeError, ValueError):
+        return [None] * count
+    if not isinstance(data, dict):
+        return [None] * count
+    return [str(data[str(i)]) if data.get(str(i)) else None for i in range(1, count + 1)]
+
+
+class _OpenAICompatibleProvider(AIProvider):
+    """Shared implementation for providers that speak the OpenAI chat-completions API"""
+
+    SDK_MODULE = "openai"
+    API_NAME = "OpenAI"  # Used in error messages
+    BASE_URL: Optional[str] = None  # None means api.openai.com
+    MAX_OUTPUT_TOKENS = 4000
 
     def __init__(self, api_key: str, model: str = None):
         super().__init__(api_key, model)
         self._client = None
 
+    def _client_kwargs(self) -> Dict:
+        """Constructor arguments for the client"""
+        kwargs = {"api_key": self.api_key}
+        if self.BASE_URL is not None:
+            kwargs["base_url"] = self.BASE_URL
+        return kwargs
+
     def _get_client(self):
-        """Get OpenAI client"""
+        """Get the OpenAI-compatible client"""
         if self._client is None:
-            from openai import OpenAI
-            self._client = OpenAI(api_key=self.api_key)
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI(**self._client_kwargs(), http_client=_shared_http_client())
         return self._client
 
-    def summarize(self, text: str) -> str:
-        """Summarize text using OpenAI"""
-        max_chars = 100000  # ~25k tokens
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n\n[Text truncated due to length...]"
+    def _stream_uncached(self, text: str) -> Iterator[str]:
+        """Stream a summary from the chat-completions API"""
+        try:
+            client = self._get_client()
+            stream = client.chat.completions.create(
+                model=self.model,
+                messages=_chat_messages(self._truncate(text)),
+                temperature=0.3,
+                max_tokens=self.MAX_OUTPUT_TOKENS,
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        except Exception as e:
+            raise Exception(f"{self.API_NAME} API error: {str(e)}")
 
+    def _summarize_uncached(self, text: str) -> str:
+        """Summarize text in one non-streaming request"""
         try:
             client = self._get_client()
             response = client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that creates clear, concise summaries of documents. Provide a well-structured summary with key points and main ideas."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Please provide a comprehensive summary of the following text:\n\n{text}"
-                    }
-                ],
+                messages=_chat_messages(self._truncate(text)),
                 temperature=0.3,
-                max_tokens=4000
+                max_tokens=self.MAX_OUTPUT_TOKENS
             )
             return response.choices[0].message.content
         except Exception as e:
-            raise Exception(f"OpenAI API error: {str(e)}")
+            raise Exception(f"{self.API_NAME} API error: {str(e)}")
+
+    def _summarize_packed_uncached(self, texts: List[str]) -> List[Optional[str]]:
+        """Summarize several short documents in one JSON-mode request"""
+        try:
+            client = self._get_client()
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=_packed_messages(texts),
+                response_format={"type": "json_object"},
+                temperature=0.3,
+                max_tokens=self.MAX_OUTPUT_TOKENS
+            )
+            return _parse_packed(response.choices[0].message.content, len(texts))
+        except Exception as e:
+            raise Exception(f"{self.API_NAME} API error: {str(e)}")
 
     def test_connection(self) -> bool:
         """Test if the API key is valid"""
@@ -165,10 +1001,35 @@ class OpenAIProvider(AIProvider):
             return False
 
 
+class OpenAIProvider(_OpenAICompatibleProvider):
+    """OpenAI ChatGPT provider"""
+
+    PROVIDER_NAME = "openai"
+    DISPLAY_NAME = "OpenAI (ChatGPT)"
+    MODELS = {
+        "gpt-4o": "GPT-4o (Best Quality)",
+        "gpt-4o-mini": "GPT-4o Mini (Fast & Cheap)",
+        "gpt-4-turbo": "GPT-4 Turbo",
+        "gpt-4": "GPT-4",
+        "gpt-3.5-turbo": "GPT-3.5 Turbo (Budget)",
+    }
+    DEFAULT_MODEL = "gpt-4o"
+    API_KEY_URL = "https://platform.openai.com/api-keys"
+    API_KEY_HELP = "Get your API key from OpenAI Platform"
+    MAX_CHARS = 100000  # ~25k tokens
+    TOKEN_LIMIT = 120_000
+    CHUNK_TOKENS = 20_000
+    PACK_SIZE = 8
+    RATE_LIMIT_RPM = 500
+    RATE_LIMIT_TPM = 30000
+    FAST_MODEL = "gpt-4o-mini"
+
+
 class ClaudeProvider(AIProvider):
     """Anthropic Claude provider"""
 
     PROVIDER_NAME = "claude"
+    SDK_MODULE = "anthropic"
     DISPLAY_NAME = "Anthropic Claude"
     MODELS = {
         "claude-sonnet-4-20250514": "Claude Sonnet 4 (Latest)",
@@ -179,6 +1040,12 @@ class ClaudeProvider(AIProvider):
     DEFAULT_MODEL = "claude-sonnet-4-20250514"
     API_KEY_URL = "https://console.anthropic.com/settings/keys"
     API_KEY_HELP = "Get your API key from Anthropic Console"
+    MAX_CHARS = 400000  # Claude has 200k context
+    TOKEN_LIMIT = 190_000  # Leaves room for the response
+    CHUNK_TOKENS = 90_000
+    RATE_LIMIT_RPM = 50
+    RATE_LIMIT_TPM = 40000
+    FAST_MODEL = "claude-3-5-haiku-20241022"
 
     def __init__(self, api_key: str, model: str = None):
         super().__init__(api_key, model)
@@ -187,32 +1054,41 @@ class ClaudeProvider(AIProvider):
     def _get_client(self):
         """Get Anthropic client"""
         if self._client is None:
-            import anthropic
-            self._client = anthropic.Anthropic(api_key=self.api_key)
+            with self._client_lock:
+                if self._client is None:
+                    import anthropic
+                    self._client = anthropic.Anthropic(api_key=self.api_key,
+                                                      http_client=_shared_http_client())
         return self._client
 
-    def summarize(self, text: str) -> str:
-        """Summarize text using Claude"""
-        max_chars = 400000  # Claude has 200k context
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n\n[Text truncated due to length...]"
+    def _build_messages(self, text: str) -> List[Dict[str, str]]:
+        """Build the user message Claude expects; the instructions go in the system prompt"""
+        return [{"role": "user", "content": self._truncate(text)}]
 
+    def _stream_uncached(self, text: str) -> Iterator[str]:
+        """Stream a summary from Claude"""
         try:
             client = self._get_client()
-            message = client.messages.create(
+            with client.messages.stream(
                 model=self.model,
                 max_tokens=4000,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"""You are a helpful assistant that creates clear, concise summaries of documents.
-Provide a well-structured summary with key points and main ideas.
-
-Please provide a comprehensive summary of the following text:
+                system=CHAT_SYSTEM_PROMPT,
+                messages=self._build_messages(text)
+            ) as stream:
+                for part in stream.text_stream:
+                    yield part
+        except Exception as e:
+            raise Exception(f"Claude API error: {str(e)}")
 
-{text}"""
-                    }
-                ]
+    def _summarize_uncached(self, text: str) -> str:
+        """Summarize text with Claude in one non-streaming request"""
+        try:
+            client = self._get_client()
+            message = client.messages.create(
+                model=self.model,
+                max_tokens=4000,
+                system=CHAT_SYSTEM_PROMPT,
+                messages=self._build_messages(text)
             )
             return message.content[0].text
         except Exception as e:
@@ -232,10 +1108,11 @@ Please provide a comprehensive summary of the following text:
             return False
 
 
-class GroqProvider(AIProvider):
-    """Groq provider (fast inference)"""
+class GroqProvider(_OpenAICompatibleProvider):
+    """Groq provider (fast inference), via Groq's OpenAI-compatible endpoint"""
 
     PROVIDER_NAME = "groq"
+    API_NAME = "Groq"
     DISPLAY_NAME = "Groq"
     MODELS = {
         "llama-3.3-70b-versatile": "Llama 3.3 70B (Best)",
@@ -247,63 +1124,22 @@ class GroqProvider(AIProvider):
     DEFAULT_MODEL = "llama-3.3-70b-versatile"
     API_KEY_URL = "https://console.groq.com/keys"
     API_KEY_HELP = "Get your free API key from Groq Console"
-
-    def __init__(self, api_key: str, model: str = None):
-        super().__init__(api_key, model)
-        self._client = None
-
-    def _get_client(self):
-        """Get Groq client"""
-        if self._client is None:
-            from groq import Groq
-            self._client = Groq(api_key=self.api_key)
-        return self._client
-
-    def summarize(self, text: str) -> str:
-        """Summarize text using Groq"""
-        max_chars = 24000  # Roughly 6000 tokens
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n\n[Text truncated due to length...]"
-
-        try:
-            client = self._get_client()
-            chat_completion = client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that creates clear, concise summaries of documents. Provide a well-structured summary with key points and main ideas."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Please provide a comprehensive summary of the following text:\n\n{text}"
-                    }
-                ],
-                model=self.model,
-                temperature=0.3,
-                max_tokens=2000
-            )
-            return chat_completion.choices[0].message.content
-        except Exception as e:
-            raise Exception(f"Groq API error: {str(e)}")
-
-    def test_connection(self) -> bool:
-        """Test if the API key is valid"""
-        try:
-            client = self._get_client()
-            response = client.chat.completions.create(
-                messages=[{"role": "user", "content": "Say OK"}],
-                model=self.model,
-                max_tokens=10
-            )
-            return bool(response.choices[0].message.content)
-        except:
-            return False
+    MAX_CHARS = 24000  # Roughly 6000 tokens
+    TOKEN_LIMIT = 6_000
+    CHUNK_TOKENS = 5_000
+    PACK_SIZE = 8
+    RATE_LIMIT_RPM = 30
+    RATE_LIMIT_TPM = 12000
+    FAST_MODEL = "llama-3.1-8b-instant"
+    BASE_URL = "https://api.groq.com/openai/v1"
+    MAX_OUTPUT_TOKENS = 2000
 
 
-class GrokProvider(AIProvider):
-    """xAI Grok provider"""
+class GrokProvider(_OpenAICompatibleProvider):
+    """xAI Grok provider (uses OpenAI-compatible API)"""
 
     PROVIDER_NAME = "grok"
+    API_NAME = "Grok"
     DISPLAY_NAME = "xAI Grok"
     MODELS = {
         "grok-2-latest": "Grok 2 (Latest)",
@@ -313,60 +1149,9 @@ class GrokProvider(AIProvider):
     DEFAULT_MODEL = "grok-2-latest"
     API_KEY_URL = "https://console.x.ai/"
     API_KEY_HELP = "Get your API key from xAI Console"
-
-    def __init__(self, api_key: str, model: str = None):
-        super().__init__(api_key, model)
-        self._client = None
-
-    def _get_client(self):
-        """Get xAI client (uses OpenAI-compatible API)"""
-        if self._client is None:
-            from openai import OpenAI
-            self._client = OpenAI(
-                api_key=self.api_key,
-                base_url="https://api.x.ai/v1"
-            )
-        return self._client
-
-    def summarize(self, text: str) -> str:
-        """Summarize text using Grok"""
-        max_chars = 100000
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n\n[Text truncated due to length...]"
-
-        try:
-            client = self._get_client()
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that creates clear, concise summaries of documents. Provide a well-structured summary with key points and main ideas."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Please provide a comprehensive summary of the following text:\n\n{text}"
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=4000
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            raise Exception(f"Grok API error: {str(e)}")
-
-    def test_connection(self) -> bool:
-        """Test if the API key is valid"""
-        try:
-            client = self._get_client()
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": "Say OK"}],
-                max_tokens=10
-            )
-            return bool(response.choices[0].message.content)
-        except:
-            return False
+    MAX_CHARS = 100000
+    PACK_SIZE = 8
+    BASE_URL = "https://api.x.ai/v1"
 
 
 # Registry of all providers
@@ -379,11 +1164,27 @@ PROVIDERS: Dict[str, type] = {
 }
 
 
+def prewarm_sdks(provider_names: List[str]):
+    """Import the vendor SDKs for the given providers so the first request does not pay for it"""
+    modules = {PROVIDERS[name].SDK_MODULE for name in provider_names if name in PROVIDERS}
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass
+
+
+@lru_cache(maxsize=16)
+def _make_provider(provider_class: type, api_key: str, model: str = None) -> AIProvider:
+    """Build a provider once per (class, key, model) so its clients are reused"""
+    return provider_class(api_key, model)
+
+
 def get_provider(provider_name: str, api_key: str, model: str = None) -> Optional[AIProvider]:
     """Factory function to get the appropriate AI provider"""
     provider_class = PROVIDERS.get(provider_name.lower())
     if provider_class:
-        return provider_class(api_key, model)
+        return _make_provider(provider_class, api_key, model)
     return None
 
 
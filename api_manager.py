@@ -2,11 +2,26 @@ import json
 import os
 import sys
 import base64
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
+
+KEYRING_SERVICE = "ddm-summarizer"
+
+# Resolved and created once, then shared by the config, theme and cache files
+_CONFIG_DIR = None
 
 
 def get_config_dir():
     """Get a writable directory for config files"""
+    global _CONFIG_DIR
+    if _CONFIG_DIR is not None:
+        return _CONFIG_DIR
+
     if sys.platform == 'win32':
         # On Windows, use LOCALAPPDATA for user-specific writable storage
         base_dir = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
@@ -16,9 +31,16 @@ def get_config_dir():
         config_dir = os.path.join(os.path.expanduser('~'), '.document_summarizer')
 
     os.makedirs(config_dir, exist_ok=True)
+    _CONFIG_DIR = config_dir
     return config_dir
 
 
+def _prewarm(provider_names: List[str]):
+    """Import the SDKs of configured providers in the background"""
+    from ai_providers import prewarm_sdks
+    prewarm_sdks(provider_names)
+
+
 class APIKeyManager:
     """Manages API keys for multiple AI providers with model selection"""
 
@@ -27,14 +49,23 @@ class APIKeyManager:
             # Use user-writable directory for config
             config_file = os.path.join(get_config_dir(), 'config.json')
         self.config_file = config_file
+        # Guards config, the key cache and the config file; the web server calls in
+        # from many threads (and without a GIL on free-threaded Python)
+        self._lock = threading.RLock()
         self.config = self._load_config()
+        self._key_cache: Dict[str, str] = {}  # provider name -> decoded API key
+        self._keyring = None
+        self._migrate_legacy_keys()
+        # Import vendor SDKs now so the first summary does not wait on them
+        threading.Thread(target=_prewarm, args=(list(self.config['providers']),), daemon=True).start()
 
     def _load_config(self) -> Dict:
         """Load configuration from file"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson else json.loads(data)
             except:
                 return self._default_config()
         return self._default_config()
@@ -47,9 +78,43 @@ class APIKeyManager:
         }
 
     def _save_config(self):
-        """Save configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        """Save configuration to file atomically (write a temp file, then swap it in)"""
+        with self._lock:
+            if orjson:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode()
+            tmp = self.config_file + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self.config_file)
+
+    def _get_keyring(self):
+        """Get the keyring module, or None if no OS credential store is available"""
+        if self._keyring is None:
+            self._keyring = False
+            try:
+                import keyring
+                # The fail backend has priority 0: no usable store on this system
+                if keyring.get_keyring().priority > 0:
+                    self._keyring = keyring
+            except Exception:
+                pass
+        return self._keyring or None
+
+    def _migrate_legacy_keys(self):
+        """Move base64 keys stored in config.json into the OS keyring"""
+        legacy = [name for name, data in self.config['providers'].items() if 'api_key' in data]
+        if not legacy or self._get_keyring() is None:
+            return
+        for name in legacy:
+            try:
+                key = self._decode_key(self.config['providers'][name]['api_key'])
+                self._keyring.set_password(KEYRING_SERVICE, name, key)
+            except Exception:
+                continue
+            del self.config['providers'][name]['api_key']
+        self._save_config()
 
     def _encode_key(self, key: str) -> str:
         """Encode API key for storage"""
@@ -61,23 +126,38 @@ class APIKeyManager:
 
     def add_provider(self, provider_name: str, api_key: str, model: str = None, set_as_default: bool = True):
         """Add or update a provider's API key and model"""
-        encoded_key = self._encode_key(api_key)
-        self.config['providers'][provider_name] = {
-            'api_key': encoded_key,
+        entry = {
             'model': model,
             'enabled': True
         }
+        keyring = self._get_keyring()
+        stored = False
+        if keyring is not None:
+            try:
+                keyring.set_password(KEYRING_SERVICE, provider_name, api_key)
+                stored = True
+            except Exception as e:
+                # Locked or broken credential store (NoKeyringError, PasswordSetError, ...)
+                print(f"Could not store the {provider_name} key in the OS keyring, "
+                      f"keeping it in config.json: {e}")
+        if not stored:
+            # No usable OS credential store; keep the key in config.json
+            entry['api_key'] = self._encode_key(api_key)
+        with self._lock:
+            self.config['providers'][provider_name] = entry
+            self._key_cache[provider_name] = api_key
 
-        if set_as_default or self.config['default_provider'] is None:
-            self.config['default_provider'] = provider_name
+            if set_as_default or self.config['default_provider'] is None:
+                self.config['default_provider'] = provider_name
 
-        self._save_config()
+            self._save_config()
 
     def update_model(self, provider_name: str, model: str):
         """Update the model for a provider"""
-        if provider_name in self.config['providers']:
-            self.config['providers'][provider_name]['model'] = model
-            self._save_config()
+        with self._lock:
+            if provider_name in self.config['providers']:
+                self.config['providers'][provider_name]['model'] = model
+                self._save_config()
 
     def get_model(self, provider_name: str = None) -> Optional[str]:
         """Get the selected model for a provider"""
@@ -91,8 +171,11 @@ class APIKeyManager:
 
     def remove_provider(self, provider_name: str):
         """Remove a provider"""
-        if provider_name in self.config['providers']:
-            del self.config['providers'][provider_name]
+        with self._lock:
+            if provider_name not in self.config['providers']:
+                return
+            data = self.config['providers'].pop(provider_name)
+            self._key_cache.pop(provider_name, None)
 
             # If this was the default, set a new default
             if self.config['default_provider'] == provider_name:
@@ -101,14 +184,32 @@ class APIKeyManager:
 
             self._save_config()
 
+        if 'api_key' not in data and self._get_keyring() is not None:
+            try:
+                self._keyring.delete_password(KEYRING_SERVICE, provider_name)
+            except Exception:
+                pass
+
     def get_api_key(self, provider_name: str = None) -> Optional[str]:
         """Get API key for a provider (uses default if not specified)"""
         if provider_name is None:
             provider_name = self.config['default_provider']
 
-        if provider_name and provider_name in self.config['providers']:
-            encoded_key = self.config['providers'][provider_name]['api_key']
-            return self._decode_key(encoded_key)
+        key = self._key_cache.get(provider_name)
+        if key is not None:
+            return key
+
+        data = self.config['providers'].get(provider_name) if provider_name else None
+        if data is not None:
+            if 'api_key' in data:
+                key = self._decode_key(data['api_key'])
+            elif self._get_keyring() is not None:
+                key = self._keyring.get_password(KEYRING_SERVICE, provider_name)
+            else:
+                key = None
+            if key is not None:
+                self._key_cache[provider_name] = key
+            return key
 
         return None
 
@@ -118,33 +219,54 @@ class APIKeyManager:
 
     def set_default_provider(self, provider_name: str):
         """Set the default provider"""
-        if provider_name in self.config['providers']:
-            self.config['default_provider'] = provider_name
-            self._save_config()
+        with self._lock:
+            if provider_name in self.config['providers']:
+                self.config['default_provider'] = provider_name
+                self._save_config()
 
     def list_providers(self) -> List[Dict]:
         """List all configured providers"""
         providers = []
-        for name, data in self.config['providers'].items():
+        with self._lock:
+            entries = list(self.config['providers'].items())
+        for name, data in entries:
             providers.append({
                 'name': name,
                 'model': data.get('model'),
                 'enabled': data.get('enabled', True),
                 'is_default': name == self.config['default_provider'],
-                'api_key_preview': self._get_key_preview(data['api_key'])
+                'api_key_preview': self._get_key_preview(name)
             })
         return providers
 
-    def _get_key_preview(self, encoded_key: str) -> str:
+    def _get_key_preview(self, provider_name: str) -> str:
         """Get a preview of the API key (first 8 chars + ...)"""
         try:
-            key = self._decode_key(encoded_key)
+            data = self.config['providers'][provider_name]
+            if provider_name not in self._key_cache and 'api_key' in data:
+                return self._preview_encoded_key(data['api_key'])
+            key = self.get_api_key(provider_name)
             if len(key) > 12:
                 return f"{key[:8]}...{key[-4:]}"
             return f"{key[:4]}..."
         except:
             return "***"
 
+    @staticmethod
+    def _preview_encoded_key(encoded_key: str) -> str:
+        """Preview a base64-stored key by decoding only its first and last blocks"""
+        # Every 4 base64 chars hold 3 bytes; the last block may be padded with '='
+        length = len(encoded_key) * 3 // 4 - encoded_key[-2:].count('=')
+        head = base64.b64decode(encoded_key[:12]).decode('ascii', 'ignore')
+        if length > 12:
+            tail = base64.b64decode(encoded_key[-8:]).decode('ascii', 'ignore')
+            return f"{head[:8]}...{tail[-4:]}"
+        return f"{head[:4]}..."
+
+    def snapshot(self) -> Tuple[bool, Optional[str]]:
+        """Return (any provider configured, default provider name) in one read"""
+        return bool(self.config['providers']), self.config['default_provider']
+
     def has_any_provider(self) -> bool:
         """Check if any provider is configured"""
         return len(self.config['providers']) > 0
@@ -152,4 +274,4 @@ class APIKeyManager:
     def validate_provider(self, provider_name: str) -> bool:
         """Check if a provider exists and has a key"""
         return (provider_name in self.config['providers'] and
-                'api_key' in self.config['providers'][provider_name])
+                self.get_api_key(provider_name) is not None)
@@ -1,24 +1,39 @@
 import os
 import io
+import re
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from cachetools import TTLCache
+from concurrent.futures import ProcessPoolExecutor
 from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
-import PyPDF2
-import pdfplumber
+import pypdfium2 as pdfium
+import pymupdf
 from docx import Document
+try:
+    import orjson
+except ImportError:  # Fall back to Flask's standard library JSON
+    orjson = None
+try:
+    from flask_compress import Compress
+except ImportError:  # Responses are sent uncompressed
+    Compress = None
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.enums import TA_JUSTIFY
-import shutil
 
 from api_manager import APIKeyManager
 from ai_providers import get_provider
 
-# Load environment variables
-load_dotenv()
-
 def get_app_data_dir():
     """Get a writable directory for app data (uploads, outputs, etc.)"""
     import sys
@@ -33,78 +48,295 @@ def get_app_data_dir():
     os.makedirs(app_data_dir, exist_ok=True)
     return app_data_dir
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes responses with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            # Options such as indent or sort_keys are only understood by the stdlib
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        data = orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(data, mimetype=self.mimetype)
+
 app = Flask(__name__)
+if orjson:
+    app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
-# Use user-writable directory for uploads and outputs
-_app_data_dir = get_app_data_dir()
-app.config['UPLOAD_FOLDER'] = os.path.join(_app_data_dir, 'uploads')
-app.config['OUTPUT_FOLDER'] = os.path.join(_app_data_dir, 'outputs')
+# Compress JSON and page responses (the summary text) with brotli, or gzip for older clients
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+if Compress:
+    Compress(app)
+
+# Created by create_app(); importing this module has no side effects
+api_manager = None
 
-# Create necessary folders
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
+def create_app():
+    """Load settings, create folders and the API key manager once, and return the app
 
-# Initialize API Key Manager
-api_manager = APIKeyManager()
+    Servers import with `app:create_app()`; run it before forking workers
+    (e.g. gunicorn --preload) so they all share the parent's setup.
+    """
+    global api_manager
+    if api_manager is None:
+        # Load environment variables
+        load_dotenv()
 
-ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc', 'txt'}
+        # Use user-writable directory for uploads
+        app.config['UPLOAD_FOLDER'] = os.path.join(get_app_data_dir(), 'uploads')
+        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+
+        # Initialize API Key Manager
+        api_manager = APIKeyManager()
+    return app
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+def file_extension(filename):
+    """Lower-cased extension of a filename, or '' if it has none"""
+    _, dot, ext = filename.rpartition('.')
+    return ext.lower() if dot else ''
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return file_extension(filename) in EXT_HANDLERS
 
-def extract_text_from_pdf(file_path):
-    """Extract text from PDF file"""
-    text = ""
+def upload_path(upload_id):
+    """Map an upload id returned by /upload-stream to its file, or None if it is malformed"""
+    stem, _, ext = upload_id.partition('.')
     try:
-        # Try pdfplumber first (better for complex PDFs)
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        uuid.UUID(hex=stem)
+    except ValueError:
+        return None
+    if ext not in EXT_HANDLERS:
+        return None
+    return os.path.join(app.config['UPLOAD_FOLDER'], f"{stem}.{ext}")
+
+# PDFs with at least this many pages are split across worker processes
+PDF_PARALLEL_MIN_PAGES = 32
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+def get_pdf_pool():
+    """Get the shared process pool used for PDF page extraction"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _pdf_pool
+
+def pdf_page_ranges(page_count):
+    """Split pages into one contiguous (start, stop) range per CPU"""
+    workers = os.cpu_count() or 1
+    step = -(-page_count // workers)
+    return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+def extract_pdf_page_range(data, start, stop):
+    """Extract the text of pages start..stop-1 (runs in a worker process)"""
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        return [doc[i].get_text("text") for i in range(start, stop)]
+
+def extract_text_from_pdf(data):
+    """Extract text from the bytes of a PDF file"""
+    # Collect pages in a list and join once; += on a str is quadratic for long PDFs
+    parts = []
+    try:
+        # PyMuPDF (MuPDF C core) is far faster than the pure-Python parsers
+        with pymupdf.open(stream=data, filetype="pdf") as doc:
+            page_count = doc.page_count
+            if page_count < PDF_PARALLEL_MIN_PAGES:
+                for page in doc:
+                    parts.append(page.get_text("text"))
+                    parts.append("\n")
+
+        if page_count >= PDF_PARALLEL_MIN_PAGES:
+            # MuPDF holds the GIL, so split contiguous page ranges across processes;
+            # map() returns them in page order
+            starts, stops = zip(*pdf_page_ranges(page_count))
+            for page_texts in get_pdf_pool().map(extract_pdf_page_range,
+                                                 [data] * len(starts), starts, stops):
+                for page_text in page_texts:
+                    parts.append(page_text)
+                    parts.append("\n")
     except Exception as e:
-        print(f"pdfplumber failed, trying PyPDF2: {e}")
-        # Fallback to PyPDF2
+        print(f"PyMuPDF failed, trying pypdfium2: {e}")
+        # Fallback to PDFium for PDFs MuPDF cannot open
+        parts = []
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+            pdf = pdfium.PdfDocument(data)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    parts.append(textpage.get_text_range())
+                    parts.append("\n")
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
         except Exception as e2:
-            print(f"PyPDF2 also failed: {e2}")
+            print(f"pypdfium2 also failed: {e2}")
             raise Exception("Could not extract text from PDF")
 
-    return text.strip()
+    return "".join(parts).strip()
 
-def extract_text_from_docx(file_path):
-    """Extract text from Word document"""
-    doc = Document(file_path)
+def extract_text_from_docx(data):
+    """Extract text from the bytes of a Word document"""
+    doc = Document(io.BytesIO(data))
     text = []
     for paragraph in doc.paragraphs:
         text.append(paragraph.text)
     return '\n'.join(text)
 
-def extract_text_from_txt(file_path):
-    """Extract text from text file"""
-    with open(file_path, 'r', encoding='utf-8') as file:
-        return file.read()
-
-def extract_text(file_path, filename):
-    """Extract text based on file type"""
-    ext = filename.rsplit('.', 1)[1].lower()
-
-    if ext == 'pdf':
-        return extract_text_from_pdf(file_path)
-    elif ext in ['docx', 'doc']:
-        return extract_text_from_docx(file_path)
-    elif ext == 'txt':
-        return extract_text_from_txt(file_path)
-    else:
+def extract_text_from_txt(data):
+    """Extract text from the bytes of a UTF-8 text file"""
+    return data.decode('utf-8')
+
+# Extracted text of recent uploads, keyed by (sha256 of the file bytes, extension)
+EXTRACTION_CACHE_SIZE = 32
+_extraction_cache = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+def get_cached_extraction(key):
+    """Return previously extracted text for a (digest, extension) key, or None"""
+    with _extraction_cache_lock:
+        text = _extraction_cache.get(key)
+        if text is not None:
+            _extraction_cache.move_to_end(key)
+        return text
+
+def cache_extraction(key, text):
+    """Remember extracted text, evicting the least recently used entry"""
+    with _extraction_cache_lock:
+        _extraction_cache[key] = text
+        if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+            _extraction_cache.popitem(last=False)
+
+# Text extractor for each supported file extension
+EXT_HANDLERS = {
+    'pdf': extract_text_from_pdf,
+    'docx': extract_text_from_docx,
+    'doc': extract_text_from_docx,
+    'txt': extract_text_from_txt,
+}
+
+def extract_text(data, filename):
+    """Extract text from file bytes based on file type, reusing the result for a re-uploaded file"""
+    ext = file_extension(filename)
+    handler = EXT_HANDLERS.get(ext)
+    if not handler:
         raise Exception(f"Unsupported file type: {ext}")
 
-def summarize_text(text):
-    """Summarize text using configured AI provider"""
+    key = (hashlib.sha256(data).hexdigest(), ext)
+    text = get_cached_extraction(key)
+    if text is None:
+        text = handler(data)
+        cache_extraction(key, text)
+    return text
+
+class DocumentError(Exception):
+    """The submitted document cannot be summarized (unreadable or too short)"""
+
+MIN_TEXT_LENGTH = 50
+
+def pdf_page_text(doc, index):
+    """Text of one page of an open PDF"""
+    return doc[index].get_text("text")
+
+async def iter_pdf_pages(data):
+    """Yield the text of each page of a PDF in order, as soon as it is extracted"""
+    doc = await asyncio.to_thread(pymupdf.open, stream=data, filetype="pdf")
+    try:
+        page_count = doc.page_count
+        if page_count < PDF_PARALLEL_MIN_PAGES:
+            for index in range(page_count):
+                yield await asyncio.to_thread(pdf_page_text, doc, index)
+            return
+    finally:
+        doc.close()
+
+    # Large PDFs: extract page ranges in the process pool, yielding each range in order
+    pool = get_pdf_pool()
+    futures = [pool.submit(extract_pdf_page_range, data, start, stop)
+               for start, stop in pdf_page_ranges(page_count)]
+    try:
+        for future in futures:
+            for page_text in await asyncio.wrap_future(future):
+                yield page_text
+    finally:
+        for future in futures:
+            future.cancel()
+
+async def iter_document_text(data, filename):
+    """Yield a document's text in pieces: PDF pages as they are extracted, other formats whole"""
+    ext = file_extension(filename)
+    if ext != 'pdf':
+        yield await asyncio.to_thread(extract_text, data, filename)
+        return
+
+    key = (hashlib.sha256(data).hexdigest(), ext)
+    text = get_cached_extraction(key)
+    if text is not None:
+        yield text
+        return
+
+    parts = []
+    try:
+        async for page_text in iter_pdf_pages(data):
+            parts.append(page_text)
+            parts.append("\n")
+            yield page_text
+            yield "\n"
+    except Exception as e:
+        if parts:
+            raise
+        # PyMuPDF could not open it; extract_text_from_pdf() falls back to pypdfium2
+        print(f"PyMuPDF failed, trying pypdfium2: {e}")
+        yield await asyncio.to_thread(extract_text, data, filename)
+        return
+    cache_extraction(key, "".join(parts).strip())
+
+async def single_piece(text):
+    """Wrap already-available text as a one-piece document"""
+    yield text
+
+async def checked_document(pieces):
+    """Pass document pieces through, raising DocumentError if unreadable or too short"""
+    length = 0
+    try:
+        async for piece in pieces:
+            length += len(piece.strip())
+            yield piece
+    except Exception as e:
+        raise DocumentError(str(e)) from e
+    if length < MIN_TEXT_LENGTH:
+        raise DocumentError('Text is too short to summarize. Please provide more content.')
+
+# Texts shorter than this are summarized locally by keeping their first sentences
+EXTRACTIVE_MAX_CHARS = 500
+EXTRACTIVE_SENTENCES = 3
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+def extractive_summary(text):
+    """Summarize a very short text by its first few sentences, without calling the AI"""
+    sentences = _SENT_RE.split(" ".join(text.split()))
+    return " ".join(sentences[:EXTRACTIVE_SENTENCES])
+
+async def prepend_pieces(head, pieces):
+    """Yield already-read pieces, then the rest of the document"""
+    for piece in head:
+        yield piece
+    async for piece in pieces:
+        yield piece
+
+async def summarize_text(pieces):
+    """Summarize a document, given as an async iterable of text pieces, using configured AI provider"""
     # Get default provider
     provider_name = api_manager.get_default_provider()
     if not provider_name:
@@ -120,55 +352,69 @@ def summarize_text(text):
     if not provider:
         raise Exception(f"Unsupported provider: {provider_name}")
 
+    # Read just far enough to tell whether the document is trivially short
+    head = []
+    size = 0
+    async for piece in pieces:
+        head.append(piece)
+        size += len(piece.strip())
+        if size >= EXTRACTIVE_MAX_CHARS:
+            break
+    else:
+        return extractive_summary("".join(head))
+
     # Summarize using the provider
     try:
-        return provider.summarize(text)
+        # Chunks are summarized as soon as they are extracted, then reduced;
+        # long documents are never truncated
+        return await provider.asummarize_pieces(prepend_pieces(head, pieces))
+    except DocumentError:
+        raise
     except Exception as e:
         raise Exception(f"Error summarizing text with {provider_name}: {str(e)}")
 
+# ReportLab styles are built once at import and shared by every PDF
+PDF_STYLES = getSampleStyleSheet()
+PDF_STYLES.add(ParagraphStyle(name='Justify', alignment=TA_JUSTIFY))
+PDF_TITLE_STYLE = PDF_STYLES['Heading1']
+PDF_BODY_STYLE = PDF_STYLES['BodyText']
+PDF_BODY_STYLE.alignment = TA_JUSTIFY
+
 def create_pdf_output(summary, original_filename):
-    """Create PDF file with summary"""
+    """Create PDF with summary in memory; returns (download filename, buffer)"""
     output_filename = f"summary_{original_filename.rsplit('.', 1)[0]}.pdf"
-    output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
+    buf = io.BytesIO()
 
     # Create PDF
-    doc = SimpleDocTemplate(output_path, pagesize=letter,
+    doc = SimpleDocTemplate(buf, pagesize=letter,
                            rightMargin=72, leftMargin=72,
                            topMargin=72, bottomMargin=18)
 
     # Container for the 'Flowable' objects
     elements = []
 
-    # Define styles
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name='Justify', alignment=TA_JUSTIFY))
-
     # Add title
-    title_style = styles['Heading1']
-    title = Paragraph(f"Summary of {original_filename}", title_style)
+    title = Paragraph(f"Summary of {original_filename}", PDF_TITLE_STYLE)
     elements.append(title)
     elements.append(Spacer(1, 12))
 
-    # Add summary text
-    summary_style = styles['BodyText']
-    summary_style.alignment = TA_JUSTIFY
-
     # Split summary into paragraphs
     for para in summary.split('\n'):
         if para.strip():
-            p = Paragraph(para, summary_style)
+            p = Paragraph(para, PDF_BODY_STYLE)
             elements.append(p)
             elements.append(Spacer(1, 12))
 
     # Build PDF
     doc.build(elements)
+    buf.seek(0)
 
-    return output_path
+    return output_filename, buf
 
 def create_docx_output(summary, original_filename):
-    """Create Word document with summary"""
+    """Create Word document with summary in memory; returns (download filename, buffer)"""
     output_filename = f"summary_{original_filename.rsplit('.', 1)[0]}.docx"
-    output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
+    buf = io.BytesIO()
 
     # Create Word document
     doc = Document()
@@ -182,9 +428,34 @@ def create_docx_output(summary, original_filename):
             doc.add_paragraph(para)
 
     # Save document
-    doc.save(output_path)
+    doc.save(buf)
+    buf.seek(0)
+
+    return output_filename, buf
+
+# Generated summaries waiting to be downloaded: download id -> (filename, bytes, created)
+DOWNLOAD_TTL_SECONDS = 3600
+_downloads = TTLCache(maxsize=64, ttl=DOWNLOAD_TTL_SECONDS)
+_downloads_lock = threading.Lock()
 
-    return output_path
+def store_download(filename, buf):
+    """Keep a generated file in memory and return the id to download it by"""
+    download_id = uuid.uuid4().hex
+    with _downloads_lock:
+        _downloads[download_id] = (filename, buf.getvalue(), time.time())
+    return download_id
+
+# Streamed uploads waiting to be summarized: upload id -> sanitized original filename
+_uploads = TTLCache(maxsize=256, ttl=DOWNLOAD_TTL_SECONDS)
+_uploads_lock = threading.Lock()
+
+def read_upload(filepath):
+    """Read a streamed upload into memory and remove it from disk"""
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read()
+    finally:
+        os.remove(filepath)
 
 # Routes
 
@@ -208,61 +479,67 @@ def settings():
     return render_template('settings.html')
 
 @app.route('/summarize', methods=['POST'])
-def summarize():
+async def summarize():
     """Handle summarization request"""
     try:
         # Check if configured
         if not api_manager.has_any_provider():
             return jsonify({'error': 'No AI provider configured. Please complete setup first.'}), 400
 
-        text_to_summarize = ""
+        pieces = None
         original_filename = "document"
 
         # Check if text was pasted/typed
         if 'manual_text' in request.form and request.form['manual_text'].strip():
-            text_to_summarize = request.form['manual_text'].strip()
+            pieces = single_piece(request.form['manual_text'].strip())
             original_filename = "manual_input.txt"
 
+        # Check if a file was already streamed to /upload-stream
+        elif request.form.get('upload_id'):
+            upload_id = request.form['upload_id']
+            filepath = upload_path(upload_id)
+            if not filepath or not os.path.exists(filepath):
+                return jsonify({'error': 'Upload not found. Please upload the file again.'}), 400
+            # The name was sanitized once in /upload-stream; never trust the client's copy
+            with _uploads_lock:
+                original_filename = _uploads.pop(upload_id, None) or os.path.basename(filepath)
+            # Read the upload once and delete it; extraction works on the bytes in memory
+            data = await asyncio.to_thread(read_upload, filepath)
+            pieces = iter_document_text(data, filepath)
+
         # Check if file was uploaded
         elif 'file' in request.files:
             file = request.files['file']
             if file and file.filename and allowed_file(file.filename):
                 filename = secure_filename(file.filename)
                 original_filename = filename
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
-
-                # Extract text from file
-                text_to_summarize = extract_text(filepath, filename)
-
-                # Clean up uploaded file
-                os.remove(filepath)
+                pieces = iter_document_text(file.read(), filename)
             else:
                 return jsonify({'error': 'Invalid file type. Please upload PDF, Word, or text file.'}), 400
         else:
             return jsonify({'error': 'No input provided. Please upload a file or paste text.'}), 400
 
-        # Check if text is not empty
-        if not text_to_summarize or len(text_to_summarize.strip()) < 50:
-            return jsonify({'error': 'Text is too short to summarize. Please provide more content.'}), 400
-
-        # Summarize the text
-        summary = summarize_text(text_to_summarize)
+        # Extract and summarize together: sections go to the AI provider while later
+        # pages are still being read
+        try:
+            summary = await summarize_text(checked_document(pieces))
+        except DocumentError as e:
+            return jsonify({'error': str(e)}), 400
 
         # Get output format preference
         output_format = request.form.get('output_format', 'pdf')
 
         # Generate output file
-        if output_format == 'word':
-            output_path = create_docx_output(summary, original_filename)
-        else:
-            output_path = create_pdf_output(summary, original_filename)
+        create_output = create_docx_output if output_format == 'word' else create_pdf_output
+        output_filename, buf = await asyncio.to_thread(create_output, summary, original_filename)
+        download_id = store_download(output_filename, buf)
 
         # Return success with download info
         return jsonify({
             'success': True,
             'summary': summary,
-            'download_filename': os.path.basename(output_path),
+            'download_id': download_id,
+            'download_filename': output_filename,
             'output_format': output_format
         })
 
@@ -270,13 +547,53 @@ def summarize():
         print(f"Error in summarize: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/download/<filename>')
-def download(filename):
-    """Download generated summary file"""
+@app.route('/upload-stream', methods=['POST'])
+def upload_stream():
+    """Receive a raw file body and write it to disk in chunks, skipping multipart parsing"""
+    filename = secure_filename(request.args.get('filename', ''))
+    if not filename or not allowed_file(filename):
+        return jsonify({'error': 'Invalid file type. Please upload PDF, Word, or text file.'}), 400
+
+    ext = file_extension(filename)
+    upload_id = f"{uuid.uuid4().hex}.{ext}"
+    filepath = upload_path(upload_id)
+    max_size = app.config['MAX_CONTENT_LENGTH']
+    written = 0
     try:
-        filepath = os.path.join(app.config['OUTPUT_FOLDER'], secure_filename(filename))
+        with open(filepath, 'wb') as f:
+            while chunk := request.stream.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > max_size:
+                    raise RequestEntityTooLarge()
+                f.write(chunk)
+    except Exception as e:
         if os.path.exists(filepath):
-            return send_file(filepath, as_attachment=True)
+            os.remove(filepath)
+        if isinstance(e, RequestEntityTooLarge):
+            return jsonify({'error': 'File is too large. The maximum size is 16MB.'}), 413
+        return jsonify({'error': str(e)}), 500
+
+    with _uploads_lock:
+        _uploads[upload_id] = filename
+    return jsonify({'success': True, 'upload_id': upload_id, 'filename': filename})
+
+@app.route('/download/<download_id>')
+def download(download_id):
+    """Download generated summary file"""
+    try:
+        with _downloads_lock:
+            entry = _downloads.get(download_id)
+        if entry:
+            filename, data, created = entry
+            # Stored files never change, so the download id doubles as the ETag and a
+            # repeat download can be answered with 304 Not Modified
+            resp = send_file(io.BytesIO(data), as_attachment=True, download_name=filename,
+                             conditional=True, etag=download_id, last_modified=created,
+                             max_age=DOWNLOAD_TTL_SECONDS)
+            # Summaries belong to one user; keep them out of shared caches
+            resp.cache_control.public = False
+            resp.cache_control.private = True
+            return resp
         else:
             return jsonify({'error': 'File not found'}), 404
     except Exception as e:
@@ -405,14 +722,22 @@ def health():
     })
 
 # Clean up old files on startup
-def cleanup_folders():
-    """Clean up upload and output folders"""
-    for folder in [app.config['UPLOAD_FOLDER'], app.config['OUTPUT_FOLDER']]:
-        if os.path.exists(folder):
-            shutil.rmtree(folder)
-        os.makedirs(folder, exist_ok=True)
+def cleanup_folders(older_than=None):
+    """Remove files left in the upload folder (summaries are kept in memory, not on disk)
+
+    With older_than (a timestamp), files modified since then are kept, so cleanup
+    can run while the server is already accepting uploads.
+    """
+    with os.scandir(app.config['UPLOAD_FOLDER']) as entries:
+        for entry in entries:
+            if entry.is_file() and (older_than is None or entry.stat().st_mtime < older_than):
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
 
 if __name__ == '__main__':
+    create_app()
     cleanup_folders()
     print("\n" + "="*60)
     print("📄 Document Summarizer is starting...")
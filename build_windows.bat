@@ -60,6 +60,18 @@ if not exist "icon.ico" (
 )
 echo.
 
+REM Optional: compile the shared modules with Cython (set CYTHONIZE=1)
+if "%CYTHONIZE%"=="1" (
+    echo    Compiling api_manager and ai_providers with Cython...
+    pip install cython --quiet
+    python setup_cython.py build_ext --inplace
+    if errorlevel 1 (
+        echo ERROR: Cython build failed
+        pause
+        exit /b 1
+    )
+)
+
 REM Step 5: Build executable with PyInstaller
 echo [5/6] Building executable with PyInstaller...
 echo    This may take a few minutes...
@@ -100,7 +112,7 @@ if exist %INNO_PATH% (
     echo WARNING: Inno Setup not found at %INNO_PATH%
     echo.
     echo The executable has been built successfully at:
-    echo %CD%\dist\DocumentSummarizer.exe
+    echo %CD%\dist\DocumentSummarizer\DocumentSummarizer.exe
     echo.
     echo To create the installer:
     echo 1. Download Inno Setup from: https://jrsoftware.org/isdl.php
@@ -1,7 +1,10 @@
 """
 Generate application icon for Document Summarizer
-Run this once to create the icon.ico file
+Run this once to create the icon.ico file and the tray icon
 """
+import os
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 def create_app_icon():
@@ -13,18 +16,14 @@ def create_app_icon():
     for size in sizes:
         width, height = size
 
-        # Create an image with gradient background
-        image = Image.new('RGB', (width, height), 'white')
+        # Gradient background (blue theme - professional), built as one array:
+        # light blue at the top fading to darker blue at the bottom
+        ramp = np.arange(height) / height
+        rows = np.stack([37 + ramp * 10, 99 + ramp * 10, 235 - ramp * 40], axis=-1).astype(np.uint8)
+        pixels = np.broadcast_to(rows[:, None, :], (height, width, 3)).copy()
+        image = Image.fromarray(pixels, 'RGB')
         dc = ImageDraw.Draw(image)
 
-        # Draw gradient background (blue theme - professional)
-        for i in range(height):
-            # Gradient from light blue to darker blue
-            r = int(37 + (i / height) * 10)
-            g = int(99 + (i / height) * 10)
-            b = int(235 - (i / height) * 40)
-            dc.rectangle([0, i, width, i+1], fill=(r, g, b))
-
         # Calculate sizes based on icon size
         margin = int(width * 0.15)
         doc_width = width - (2 * margin)
@@ -90,5 +89,26 @@ def create_app_icon():
     images[0].save('icon.png', format='PNG')
     print("PNG version created: icon.png")
 
+def create_tray_icon():
+    """Draw the desktop launcher's tray icon and save it as assets/tray_icon.png"""
+    # Create an image with a white background
+    image = Image.new('RGB', (64, 64), 'white')
+    dc = ImageDraw.Draw(image)
+
+    # Draw a simple document icon
+    # Document outline
+    dc.rectangle([10, 5, 54, 59], outline='#4CAF50', width=3, fill='white')
+    # Folded corner
+    dc.polygon([54, 5, 54, 15, 44, 5], fill='#4CAF50')
+    # Lines representing text
+    dc.rectangle([18, 20, 46, 23], fill='#666666')
+    dc.rectangle([18, 28, 46, 31], fill='#666666')
+    dc.rectangle([18, 36, 38, 39], fill='#666666')
+
+    os.makedirs('assets', exist_ok=True)
+    image.save(os.path.join('assets', 'tray_icon.png'), format='PNG')
+    print("Tray icon created: assets/tray_icon.png")
+
 if __name__ == '__main__':
     create_app_icon()
+    create_tray_icon()
@@ -1,97 +1,263 @@
 """
 Desktop Launcher for Document Summarizer
 Runs the Flask app in background with system tray icon
+
+Set DDM_SERVER to a backend name (uvicorn, waitress, werkzeug, gevent) to pick the server.
 """
 import os
+
+# gevent has to patch the standard library before anything else imports it.
+# OS threads are left unpatched so the tray icon keeps its own native thread.
+SERVER_BACKEND = os.environ.get('DDM_SERVER')
+if SERVER_BACKEND == 'gevent':
+    from gevent import monkey
+    monkey.patch_all(thread=False)
+
+import asyncio
+import multiprocessing
+import socket
 import sys
 import threading
-import webbrowser
 import time
-from pathlib import Path
-import pystray
-from PIL import Image, ImageDraw
-from werkzeug.serving import make_server
 
-# Import the Flask app
-from app import app, cleanup_folders, api_manager
+# pystray, PIL and the Flask app itself are imported where they are
+# first used, so the port is bound before their module graphs are loaded
+
+# How long Quit waits for requests in flight (e.g. a summary being generated)
+SHUTDOWN_TIMEOUT = 180
+
+
+class UvicornServer:
+    """Run the app on uvicorn's asyncio event loop (DDM_SERVER=uvicorn)"""
+
+    def __init__(self, flask_app, sock):
+        import uvicorn
+        # uvicorn's WSGI interface runs each request on a thread pool; asgiref's
+        # WsgiToAsgi would run them one at a time (it is thread-sensitive)
+        config = uvicorn.Config(flask_app, interface="wsgi", log_level="info", loop="asyncio")
+        self._server = uvicorn.Server(config)
+        self._sock = sock
+
+    def serve(self):
+        self._server.run(sockets=[self._sock])
+
+    async def serve_async(self):
+        await self._server.serve(sockets=[self._sock])
+
+    def stop(self):
+        # Checked by uvicorn's main loop, which then shuts down gracefully
+        self._server.should_exit = True
+
+
+class WaitressServer:
+    """Run the app on waitress: an asynchronous acceptor feeding a bounded thread pool"""
+
+    def __init__(self, flask_app, sock):
+        from waitress import create_server
+        self._server = create_server(flask_app, sockets=[sock],
+                                     threads=8, connection_limit=200, channel_timeout=120)
+
+    def serve(self):
+        self._server.run()
+        self._server.task_dispatcher.shutdown()
+
+    async def serve_async(self):
+        await asyncio.to_thread(self.serve)
+
+    def busy(self):
+        """Whether a request is being handled or a response is still being sent"""
+        return bool(self._server.task_dispatcher.active_count or any(
+            getattr(channel, 'requests', None) or getattr(channel, 'total_outbufs_len', 0)
+            for channel in list(self._server._map.values())))
+
+    def stop(self):
+        from waitress.wasyncore import close_all, dispatcher
+        # Socket changes run on waitress's own loop thread, handed over via its trigger.
+        # Stop accepting, let requests in flight finish, then close the idle connections
+        # so run() returns.
+        self._server.trigger.pull_trigger(lambda: dispatcher.close(self._server))
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        while self.busy() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self._server.trigger.pull_trigger(lambda: close_all(self._server._map))
+
+
+class GeventServer:
+    """Run the app on gevent's WSGI server, one greenlet per request (DDM_SERVER=gevent)"""
+
+    def __init__(self, flask_app, sock):
+        from gevent.pywsgi import WSGIServer  # fail here, not in the serving thread
+        self._server_class = WSGIServer
+        self._app = flask_app
+        self._sock = sock
+        # gevent objects belong to the hub of the thread that creates them, so the
+        # server is built in serve(); stop() may run before that
+        self._lock = threading.Lock()
+        self._stopping = False
+        self._server = None
+        self._hub = None
+
+    def serve(self):
+        import gevent
+        with self._lock:
+            if self._stopping:
+                return
+            self._hub = gevent.get_hub()
+            self._server = self._server_class(self._sock, self._app)
+            # Requests in flight get this long to finish once stop() is called
+            self._server.stop_timeout = SHUTDOWN_TIMEOUT
+        self._server.serve_forever()
+
+    async def serve_async(self):
+        # Real OS thread (threads are not patched) with its own gevent hub
+        await asyncio.to_thread(self.serve)
+
+    def stop(self):
+        import gevent
+        with self._lock:
+            self._stopping = True
+            if self._hub is not None:
+                # Hand the stop over to the serving thread's hub
+                self._hub.loop.run_callback_threadsafe(gevent.spawn, self._server.stop)
+
+
+class WerkzeugServer:
+    """Run the app on werkzeug's threaded server (always installed with Flask)"""
+
+    def __init__(self, flask_app, sock):
+        from werkzeug.serving import make_server
+        host, port = sock.getsockname()[:2]
+        self._server = make_server(host, port, flask_app, threaded=True, fd=sock.fileno())
+        # Track request threads so server_close() waits for requests in flight
+        self._server.daemon_threads = False
+
+    def serve(self):
+        # shutdown() is noticed at the next poll: 50 ms instead of the default 500 ms
+        self._server.serve_forever(poll_interval=0.05)
+        self._server.server_close()
+
+    async def serve_async(self):
+        await asyncio.to_thread(self.serve)
+
+    def stop(self):
+        self._server.shutdown()
+
+
+# Server backends in order of preference; the first one installed is used.
+# Both handle requests on threads, so a long /summarize never blocks polling or downloads
+SERVER_BACKENDS = {
+    'waitress': WaitressServer,
+    'werkzeug': WerkzeugServer,
+}
+
+# Backends only used when named in DDM_SERVER (gevent must patch the stdlib at startup)
+OPT_IN_BACKENDS = {
+    'uvicorn': UvicornServer,
+    'gevent': GeventServer,
+}
+
+
+def create_server(flask_app, sock, backend=SERVER_BACKEND):
+    """Create the named server backend, or the preferred installed one, on a listening socket"""
+    if backend:
+        backends = {**SERVER_BACKENDS, **OPT_IN_BACKENDS}
+        if backend not in backends:
+            raise RuntimeError(f"Unknown server backend: {backend}")
+        return backends[backend](flask_app, sock)
+    for server_class in SERVER_BACKENDS.values():
+        try:
+            return server_class(flask_app, sock)
+        except ImportError:
+            continue
+    raise RuntimeError(f"No server backend installed (tried {', '.join(SERVER_BACKENDS)})")
+
 
 class DocumentSummarizerApp:
     def __init__(self):
         self.server = None
-        self.server_thread = None
+        self.server_socket = None
         self.port = 5000
         self.host = '127.0.0.1'
         self.icon = None
         self.running = False
+        # Set once Quit is requested; the server task checks it before serving
+        self.stop_event = threading.Event()
 
     def create_icon_image(self):
-        """Create a simple icon for the system tray"""
-        # Create a simple icon with a document symbol
-        width = 64
-        height = 64
-
-        # Create an image with a white background
-        image = Image.new('RGB', (width, height), 'white')
-        dc = ImageDraw.Draw(image)
-
-        # Draw a simple document icon
-        # Document outline
-        dc.rectangle([10, 5, 54, 59], outline='#4CAF50', width=3, fill='white')
-        # Folded corner
-        dc.polygon([54, 5, 54, 15, 44, 5], fill='#4CAF50')
-        # Lines representing text
-        dc.rectangle([18, 20, 46, 23], fill='#666666')
-        dc.rectangle([18, 28, 46, 31], fill='#666666')
-        dc.rectangle([18, 36, 38, 39], fill='#666666')
-
-        return image
+        """Load the tray icon drawn at build time by create_icon.py"""
+        from PIL import Image
+        # PyInstaller unpacks bundled data files to sys._MEIPASS
+        base = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+        with Image.open(os.path.join(base, 'assets', 'tray_icon.png')) as image:
+            return image.copy()
 
     def open_browser(self):
         """Open the app in the default browser"""
         url = f'http://{self.host}:{self.port}'
-        webbrowser.open(url)
-
-    def start_flask_server(self):
-        """Start the Flask server in a separate thread"""
+        # Hand the URL straight to the OS; webbrowser probes a chain of backends first
         try:
-            # Clean up folders
-            cleanup_folders()
+            if sys.platform == 'win32':
+                os.startfile(url)
+            else:
+                import subprocess
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen([opener, url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            import webbrowser
+            webbrowser.open(url)
 
-            # Create the server
-            self.server = make_server(self.host, self.port, app, threaded=True)
-            self.running = True
+    def prepare_server(self):
+        """Import and set up the Flask app, then create the server on the bound socket"""
+        # Import and set up the app
+        import app as summarizer
+        flask_app = summarizer.create_app()
 
-            print(f"\n{'='*60}")
-            print("📄 Document Summarizer is running...")
-            print(f"{'='*60}\n")
+        # Clear old uploads in the background; unlink calls release the GIL and
+        # overlap with building the server. Files uploaded from now on are kept.
+        threading.Thread(target=summarizer.cleanup_folders, args=(time.time(),),
+                         daemon=True).start()
 
-            if not api_manager.has_any_provider():
-                print("⚠️  No AI provider configured yet!")
-                print("The setup wizard will open in your browser.\n")
-            else:
-                default = api_manager.get_default_provider()
-                print(f"✅ Using {default.upper()} as the default AI provider\n")
+        # Create the server on the socket bound in run()
+        self.server = create_server(flask_app, self.server_socket)
+        self.running = True
 
-            print(f"🌐 Access the app at: http://{self.host}:{self.port}")
-            print("💡 Use the system tray icon to quit\n")
+        self.print_startup_banner(*summarizer.api_manager.snapshot())
 
-            # Open browser after a short delay
-            time.sleep(2)
-            self.open_browser()
+    def print_startup_banner(self, has_provider, default_provider):
+        """Print the startup banner for the configured provider state"""
+        print(f"\n{'='*60}")
+        print("📄 Document Summarizer is running...")
+        print(f"{'='*60}\n")
 
-            # Start serving
-            self.server.serve_forever()
+        if not has_provider:
+            print("⚠️  No AI provider configured yet!")
+            print("The setup wizard will open in your browser.\n")
+        else:
+            print(f"✅ Using {default_provider.upper()} as the default AI provider\n")
 
+        print(f"🌐 Access the app at: http://{self.host}:{self.port}")
+        print("💡 Use the system tray icon to quit\n")
+
+    async def start_flask_server(self):
+        """Set up the app off the event loop, then serve until stop_server() is called"""
+        try:
+            await asyncio.to_thread(self.prepare_server)
+            # Quit may have been clicked while the app was still loading
+            if not self.stop_event.is_set():
+                await self.server.serve_async()
         except Exception as e:
             print(f"Error starting server: {e}")
             self.running = False
 
     def stop_server(self):
         """Stop the Flask server"""
+        if self.stop_event.is_set():
+            return
+        self.stop_event.set()
         if self.server:
             print("\n📄 Shutting down Document Summarizer...")
             self.running = False
-            self.server.shutdown()
+            self.server.stop()
 
     def on_open_clicked(self, icon, item):
         """Handle 'Open' menu click"""
@@ -104,6 +270,8 @@ class DocumentSummarizerApp:
 
     def setup_tray_icon(self):
         """Setup the system tray icon"""
+        import pystray
+
         # Create icon image
         icon_image = self.create_icon_image()
 
@@ -121,19 +289,37 @@ class DocumentSummarizerApp:
             menu
         )
 
+    def serve(self):
+        """Run the server on its own event loop until stop_server() is called"""
+        asyncio.run(self.start_flask_server())
+
     def run(self):
         """Run the application"""
-        # Start Flask server in background thread
-        self.server_thread = threading.Thread(target=self.start_flask_server, daemon=True)
-        self.server_thread.start()
+        # Bind the port before the event loop or any thread starts: from here on the
+        # OS queues the browser's connection until the server starts accepting
+        try:
+            self.server_socket = socket.create_server((self.host, self.port))
+        except OSError as e:
+            print(f"Error starting server: {e}")
+
+        # The server's event loop gets a thread of its own; pystray's run() has to
+        # stay on the main thread, where macOS requires the status item to be created
+        server_thread = None
+        if self.server_socket is not None:
+            # Daemon, so a request stuck past SHUTDOWN_TIMEOUT cannot keep the process alive
+            server_thread = threading.Thread(target=self.serve, daemon=True)
+            server_thread.start()
+            self.open_browser()
 
         # Setup and run system tray icon (this blocks until quit)
         self.setup_tray_icon()
         self.icon.run()
 
-        # Wait for server thread to finish
-        if self.server_thread.is_alive():
-            self.server_thread.join(timeout=2)
+        # Let the server finish in-flight requests and exit, so a summary being
+        # generated when Quit is clicked is not cut off, up to SHUTDOWN_TIMEOUT
+        self.stop_server()
+        if server_thread is not None:
+            server_thread.join(timeout=SHUTDOWN_TIMEOUT)
 
 def main():
     """Main entry point"""
@@ -152,4 +338,7 @@ def main():
     app_instance.run()
 
 if __name__ == '__main__':
+    # Lets app.py's PDF worker processes start from the frozen executable
+    # instead of re-running the launcher
+    multiprocessing.freeze_support()
     main()
@@ -10,22 +10,99 @@ __app_name__ = "Document Summarizer"
 import os
 import sys
 import json
+import importlib
+import multiprocessing
+import queue
 import threading
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, lru_cache, partial
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 from typing import Optional
-import PyPDF2
-import pdfplumber
-from docx import Document
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.enums import TA_JUSTIFY
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
 
 from api_manager import APIKeyManager, get_config_dir
-from ai_providers import get_provider, get_all_providers, get_provider_info, PROVIDERS
+from ai_providers import get_provider, get_all_providers, PROVIDERS
+
+# Document libraries pull in hundreds of submodules; they are imported the first
+# time a file is loaded or exported, not before the first window is drawn
+_LIBS = {}
+
+
+def _lazy_import(name: str):
+    """Import a module on first use and keep it for later calls"""
+    module = _LIBS.get(name)
+    if module is None:
+        module = _LIBS[name] = importlib.import_module(name)
+    return module
+
+
+def _get_pdfplumber():
+    """pdfplumber, the primary PDF text extractor"""
+    return _lazy_import("pdfplumber")
+
+
+def _get_pdf_reader():
+    """PyPDF2, the fallback PDF text extractor"""
+    return _lazy_import("PyPDF2")
+
+
+def _get_docx():
+    """python-docx, for reading and writing Word documents"""
+    return _lazy_import("docx")
+
+
+def _prewarm_document_libs():
+    """Import the document readers in the background so the first file load does not wait on them"""
+    for getter in (_get_pdfplumber, _get_docx):
+        try:
+            getter()
+        except Exception:
+            pass
+
+
+# PDFs with at least this many pages are split across worker processes; pdfminer,
+# which pdfplumber parses with, is pure Python and holds the GIL, so threads would
+# not overlap
+PDF_PARALLEL_MIN_PAGES = 32
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool():
+    """Get the shared process pool used for PDF page extraction"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _pdf_pool
+
+
+def _pdf_page_ranges(page_count: int):
+    """Split pages into one contiguous (start, stop) range per CPU"""
+    workers = os.cpu_count() or 1
+    step = -(-page_count // workers)
+    return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+
+def _extract_pdf_page_range(file_path: str, start: int, stop: int):
+    """Extract the text of pages start..stop-1 (runs in a worker process)"""
+    # pdfplumber numbers pages from 1
+    with _get_pdfplumber().open(file_path, pages=list(range(start + 1, stop + 1))) as pdf:
+        return [page.extract_text() for page in pdf.pages]
+
+
+@lru_cache(maxsize=64)
+def _font(size: int, weight: str = "normal", underline: bool = False):
+    """Shared CTkFont for a size and style; each new one registers a Tk named font"""
+    return ctk.CTkFont(size=size, weight=weight, underline=underline)
 
 # Configure CustomTkinter
 ctk.set_default_color_theme("blue")
@@ -95,20 +172,26 @@ class ThemeManager:
     }
 
     def __init__(self):
-        self.config_path = os.path.join(get_config_dir(), "theme_config.json")
         self.current_theme = self.LIGHT_THEME
         self.load_theme()
 
+    @cached_property
+    def config_path(self) -> str:
+        """Path of the saved theme preference"""
+        return os.path.join(get_config_dir(), "theme_config.json")
+
     def load_theme(self):
         """Load theme from config file"""
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
-                    if config.get("theme") == "dark":
-                        self.current_theme = self.DARK_THEME
-                    else:
-                        self.current_theme = self.LIGHT_THEME
+            with open(self.config_path, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data) if orjson else json.loads(data)
+            if config.get("theme") == "dark":
+                self.current_theme = self.DARK_THEME
+            else:
+                self.current_theme = self.LIGHT_THEME
+        except FileNotFoundError:
+            pass
         except Exception:
             self.current_theme = self.LIGHT_THEME
 
@@ -117,8 +200,9 @@ class ThemeManager:
     def save_theme(self):
         """Save theme preference to config file"""
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump({"theme": self.current_theme["name"]}, f)
+            config = {"theme": self.current_theme["name"]}
+            with open(self.config_path, 'wb') as f:
+                f.write(orjson.dumps(config) if orjson else json.dumps(config).encode())
         except Exception:
             pass
 
@@ -137,39 +221,108 @@ class ThemeManager:
         """Check if current theme is dark"""
         return self.current_theme["name"] == "dark"
 
+    @property
+    def palette(self) -> dict:
+        """The current theme's colors, for direct indexing"""
+        return self.current_theme
+
     def get(self, key: str) -> str:
         """Get a theme color value"""
         return self.current_theme.get(key, "#FFFFFF")
 
 
-# Legacy Colors class for backward compatibility during transition
-class Colors:
-    # These will be updated dynamically based on theme
-    BG_PRIMARY = "#FFFFFF"
-    BG_SECONDARY = "#F8FAFC"
-    BG_TERTIARY = "#F1F5F9"
-    TEXT_PRIMARY = "#0F172A"
-    TEXT_SECONDARY = "#475569"
-    TEXT_MUTED = "#94A3B8"
-    BLUE_PRIMARY = "#2563EB"
-    BLUE_HOVER = "#1D4ED8"
-    BLUE_LIGHT = "#DBEAFE"
-    GREEN_PRIMARY = "#059669"
-    GREEN_HOVER = "#047857"
-    GREEN_LIGHT = "#D1FAE5"
-    SUCCESS = "#10B981"
-    ERROR = "#EF4444"
-    WARNING = "#F59E0B"
-    BORDER = "#E2E8F0"
-    DIVIDER = "#CBD5E1"
-
-    PROVIDER_COLORS = {
-        "gemini": "#4285F4",
-        "openai": "#10A37F",
-        "claude": "#CC785C",
-        "groq": "#F55036",
-        "grok": "#1DA1F2",
+# Export styles offered on the output tab: (value, label, description)
+_STYLE_OPTIONS = (
+    ("professional", "Professional", "Clean layout with headers and structured paragraphs"),
+    ("bullet_points", "Bullet Points", "Key points as a bulleted list for quick reading"),
+    ("numbered_list", "Numbered List", "Organized numbered sections for easy reference"),
+    ("executive", "Executive Summary", "Concise highlights with bold key takeaways"),
+    ("detailed", "Detailed Report", "Comprehensive format with sections and subsections"),
+    ("minimalist", "Minimalist", "Simple, clean text with minimal formatting"),
+)
+
+# Export color schemes: (value, label, swatch color)
+_COLOR_OPTIONS = (
+    ("blue", "Blue", "#2563EB"),
+    ("green", "Green", "#059669"),
+    ("purple", "Purple", "#7C3AED"),
+    ("red", "Red", "#DC2626"),
+    ("orange", "Orange", "#EA580C"),
+    ("gray", "Grayscale", "#475569"),
+)
+
+# ReportLab stylesheets for PDF export, built once per color scheme
+_STYLE_CACHE = {}
+
+# Accent colors for DOCX export, as (red, green, blue)
+_DOCX_ACCENT_RGB = {
+    "blue": (37, 99, 235),
+    "green": (5, 150, 105),
+    "purple": (124, 58, 237),
+    "red": (220, 38, 38),
+    "orange": (234, 88, 12),
+    "gray": (71, 85, 105),
+}
+
+# API key instructions shown on the help tab
+_HELP_PROVIDERS = (
+    {
+        "name": "Google Gemini",
+        "color": ThemeManager.PROVIDER_COLORS["gemini"],
+        "free": True,
+        "url": "https://aistudio.google.com/app/apikey",
+        "steps": (
+            "1. Go to Google AI Studio (aistudio.google.com)",
+            "2. Sign in with your Google account",
+            "3. Click 'Get API Key' in the sidebar",
+            "4. Create a new API key",
+            "5. Copy and paste it here"
+        ),
+        "notes": "Free tier: 15 requests/minute. Recommended for most users!"
+    },
+    {
+        "name": "OpenAI (GPT)",
+        "color": ThemeManager.PROVIDER_COLORS["openai"],
+        "free": False,
+        "url": "https://platform.openai.com/api-keys",
+        "steps": (
+            "1. Go to platform.openai.com",
+            "2. Sign up or log in",
+            "3. Navigate to API Keys",
+            "4. Create a new secret key",
+            "5. Add a payment method"
+        ),
+        "notes": "Paid only. Requires billing setup."
+    },
+    {
+        "name": "Anthropic Claude",
+        "color": ThemeManager.PROVIDER_COLORS["claude"],
+        "free": False,
+        "url": "https://console.anthropic.com/settings/keys",
+        "steps": (
+            "1. Go to console.anthropic.com",
+            "2. Sign up and verify email",
+            "3. Navigate to API Keys",
+            "4. Create a new key",
+            "5. Add credits in Billing"
+        ),
+        "notes": "Paid only. High-quality responses."
+    },
+    {
+        "name": "Groq",
+        "color": ThemeManager.PROVIDER_COLORS["groq"],
+        "free": True,
+        "url": "https://console.groq.com/keys",
+        "steps": (
+            "1. Go to console.groq.com",
+            "2. Sign up for free",
+            "3. Navigate to API Keys",
+            "4. Create a new key",
+            "5. No payment needed!"
+        ),
+        "notes": "Free tier available! Very fast."
     }
+)
 
 
 class DocumentSummarizerApp(TkinterDnD.Tk):
@@ -180,15 +333,22 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
 
         # Initialize theme manager first
         self.theme = ThemeManager()
+        # Current palette; every color key used by the UI exists in both themes
+        self.C = self.theme.palette
 
         self.title("Document Summarizer")
         self.geometry("1000x700")
         self.minsize(850, 600)
-        self.configure(bg=self.theme.get("BG_PRIMARY"))
+        self.configure(bg=self.C["BG_PRIMARY"])
 
         # Initialize API manager
         self.api_manager = APIKeyManager()
 
+        # Provider details and model names, read once from the provider registry
+        self._provider_cache = get_all_providers()
+        self._provider_models_list = {name: list(info['models'].values())
+                                      for name, info in self._provider_cache.items()}
+
         # Track current state
         self.current_file_path: Optional[str] = None
         self.extracted_text: Optional[str] = None
@@ -196,25 +356,85 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         self.original_filename: str = "document"
         self.current_tab: str = "summarize"
 
-        # Create main container
-        self.main_container = ctk.CTkFrame(self, fg_color=self.theme.get("BG_PRIMARY"), corner_radius=0)
-        self.main_container.pack(fill="both", expand=True)
+        # Input mode and export choices, kept across rebuilds of the tabs
+        self.input_mode_var = ctk.StringVar(value="upload")
+        self.export_format_var = ctk.StringVar(value="pdf")
+        self.export_style_var = ctk.StringVar(value="professional")
+        self.export_color_var = ctk.StringVar(value="blue")
+
+        # Tab contents are built on first visit and kept; switches are coalesced
+        self._tab_frames: dict = {}
+        self._switch_job = None
+        self._tab_builders = {
+            "summarize": self._create_summarize_tab,
+            "output": self._create_output_tab,
+            "settings": self._create_settings_tab,
+            "help": self._create_help_tab,
+        }
+
+        # File extraction and summarization run in order on one background worker
+        self._work_q = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+        # Connection tests run one at a time on a single worker thread; results come
+        # back through a queue drained on the Tk thread while any test is outstanding,
+        # and only the latest is shown
+        self._test_requests = queue.Queue()
+        self._test_results = queue.Queue()
+        self._test_worker = None
+        self._latest_test_id = 0
+        self._tests_pending = 0
+        self._test_poll_job = None
+
+        # Widgets built with _themed(), recolored in place when the theme is toggled
+        self._themed_widgets: list = []
+
+        # One click handler for every export style row
+        self.bind_class("StyleRow", "<Button-1>", self._on_style_row_click)
 
         # Check if setup is needed
-        if not self.api_manager.has_any_provider():
-            self.show_setup_view()
-        else:
-            self.show_main_view()
+        show_view = self.show_main_view if self.api_manager.has_any_provider() else self.show_setup_view
+
+        # Create main container in the final theme colors, then build the view into it;
+        # the container starts empty, so the first view skips clear_container()
+        self.main_container = ctk.CTkFrame(self, fg_color=self.C["BG_PRIMARY"], corner_radius=0)
+        self.main_container.pack(fill="both", expand=True)
+        self._apply_ttk_styles()
+        self._first_view_built = False
+        show_view()
+
+        # Once the window is up, load the document readers on the worker thread
+        self.after_idle(self._work_q.put, _prewarm_document_libs)
 
     def clear_container(self):
         """Clear all widgets from main container"""
+        if not self._first_view_built:
+            self._first_view_built = True
+            return
         for widget in self.main_container.winfo_children():
             widget.destroy()
+        self._themed_widgets = []
+        self._tab_frames = {}
+        if self._switch_job is not None:
+            self.after_cancel(self._switch_job)
+            self._switch_job = None
+
+    def _themed(self, widget_cls, parent, **kwargs):
+        """Create a widget whose color options may name theme keys, and register it for recoloring"""
+        palette = self.C
+        mapping = {k: v for k, v in kwargs.items()
+                   if k.endswith("_color") and v in palette}
+        kwargs.update({k: palette[v] for k, v in mapping.items()})
+        widget = widget_cls(parent, **kwargs)
+        if mapping:
+            self._themed_widgets.append((widget, mapping))
+        return widget
 
     def refresh_ui(self):
         """Refresh the entire UI with current theme"""
-        self.configure(bg=self.theme.get("BG_PRIMARY"))
-        self.main_container.configure(fg_color=self.theme.get("BG_PRIMARY"))
+        self.configure(bg=self.C["BG_PRIMARY"])
+        self.main_container.configure(fg_color=self.C["BG_PRIMARY"])
         if self.api_manager.has_any_provider():
             self.show_main_view()
         else:
@@ -227,42 +447,39 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         self.clear_container()
 
         # Main setup container with max width
-        setup_wrapper = ctk.CTkFrame(self.main_container, fg_color=Colors.BG_PRIMARY)
+        setup_wrapper = ctk.CTkFrame(self.main_container, fg_color=self.C["BG_PRIMARY"])
         setup_wrapper.pack(fill="both", expand=True)
 
         # Scrollable frame for setup content
-        setup_frame = ctk.CTkFrame(setup_wrapper, fg_color=Colors.BG_PRIMARY, width=600)
+        setup_frame = ctk.CTkFrame(setup_wrapper, fg_color=self.C["BG_PRIMARY"], width=600)
         setup_frame.place(relx=0.5, rely=0.5, anchor="center")
 
         # Header
-        header_frame = ctk.CTkFrame(setup_frame, fg_color="transparent")
-        header_frame.pack(fill="x", pady=(0, 30))
-
         title_label = ctk.CTkLabel(
-            header_frame,
+            setup_frame,
             text="Document Summarizer",
-            font=ctk.CTkFont(size=36, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY
+            font=_font(size=36, weight="bold"),
+            text_color=self.C["TEXT_PRIMARY"]
         )
         title_label.pack()
 
         subtitle_label = ctk.CTkLabel(
-            header_frame,
+            setup_frame,
             text="Connect your AI provider to get started",
-            font=ctk.CTkFont(size=16),
-            text_color=Colors.TEXT_SECONDARY
+            font=_font(size=16),
+            text_color=self.C["TEXT_SECONDARY"]
         )
-        subtitle_label.pack(pady=(8, 0))
+        subtitle_label.pack(pady=(8, 30))
 
         # Provider selection card
-        provider_card = ctk.CTkFrame(setup_frame, fg_color=Colors.BG_SECONDARY, corner_radius=16)
+        provider_card = ctk.CTkFrame(setup_frame, fg_color=self.C["BG_SECONDARY"], corner_radius=16)
         provider_card.pack(fill="x", pady=(0, 20))
 
         provider_header = ctk.CTkLabel(
             provider_card,
             text="Choose AI Provider",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY
+            font=_font(size=18, weight="bold"),
+            text_color=self.C["TEXT_PRIMARY"]
         )
         provider_header.pack(pady=(24, 16), padx=24, anchor="w")
 
@@ -273,29 +490,26 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         self.selected_provider = ctk.StringVar(value="gemini")
         self.provider_buttons = {}
 
-        all_providers = get_all_providers()
+        all_providers = self._provider_cache
         row = 0
         col = 0
 
         for provider_name, info in all_providers.items():
-            btn_frame = ctk.CTkFrame(providers_frame, fg_color="transparent")
-            btn_frame.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
-
             btn = ctk.CTkButton(
-                btn_frame,
+                providers_frame,
                 text=info['display_name'],
                 width=170,
                 height=50,
-                font=ctk.CTkFont(size=14),
-                fg_color=Colors.BG_PRIMARY,
-                text_color=Colors.TEXT_PRIMARY,
+                font=_font(size=14),
+                fg_color=self.C["BG_PRIMARY"],
+                text_color=self.C["TEXT_PRIMARY"],
                 border_width=2,
-                border_color=Colors.BORDER,
-                hover_color=Colors.BLUE_LIGHT,
+                border_color=self.C["BORDER"],
+                hover_color=self.C["ACCENT_LIGHT"],
                 corner_radius=10,
-                command=lambda p=provider_name: self.select_provider(p)
+                command=partial(self.select_provider, provider_name)
             )
-            btn.pack(fill="x")
+            btn.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
             self.provider_buttons[provider_name] = btn
 
             col += 1
@@ -308,22 +522,22 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             providers_frame.columnconfigure(i, weight=1)
 
         # API Key input card
-        key_card = ctk.CTkFrame(setup_frame, fg_color=Colors.BG_SECONDARY, corner_radius=16)
+        key_card = ctk.CTkFrame(setup_frame, fg_color=self.C["BG_SECONDARY"], corner_radius=16)
         key_card.pack(fill="x", pady=(0, 20))
 
         key_header = ctk.CTkLabel(
             key_card,
             text="Enter API Key",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY
+            font=_font(size=18, weight="bold"),
+            text_color=self.C["TEXT_PRIMARY"]
         )
         key_header.pack(pady=(24, 8), padx=24, anchor="w")
 
         self.api_help_label = ctk.CTkLabel(
             key_card,
             text="Get your free API key from Google AI Studio",
-            font=ctk.CTkFont(size=13),
-            text_color=Colors.TEXT_SECONDARY
+            font=_font(size=13),
+            text_color=self.C["TEXT_SECONDARY"]
         )
         self.api_help_label.pack(padx=24, anchor="w")
 
@@ -335,10 +549,10 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             key_entry_frame,
             placeholder_text="Paste your API key here...",
             height=50,
-            font=ctk.CTkFont(size=14),
+            font=_font(size=14),
             show="*",
             border_width=2,
-            border_color=Colors.BORDER,
+            border_color=self.C["BORDER"],
             corner_radius=10
         )
         self.api_key_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
@@ -349,10 +563,10 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             text="Show",
             width=70,
             height=50,
-            font=ctk.CTkFont(size=13),
-            fg_color=Colors.BG_TERTIARY,
-            text_color=Colors.TEXT_SECONDARY,
-            hover_color=Colors.BORDER,
+            font=_font(size=13),
+            fg_color=self.C["BG_TERTIARY"],
+            text_color=self.C["TEXT_SECONDARY"],
+            hover_color=self.C["BORDER"],
             corner_radius=10,
             command=self.toggle_key_visibility
         )
@@ -362,10 +576,10 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         self.get_key_link = ctk.CTkButton(
             key_card,
             text="Get API Key",
-            font=ctk.CTkFont(size=13, underline=True),
+            font=_font(size=13, underline=True),
             fg_color="transparent",
-            text_color=Colors.BLUE_PRIMARY,
-            hover_color=Colors.BG_TERTIARY,
+            text_color=self.C["ACCENT_PRIMARY"],
+            hover_color=self.C["BG_TERTIARY"],
             height=30,
             command=self.open_api_key_url
         )
@@ -378,8 +592,8 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         model_label = ctk.CTkLabel(
             model_frame,
             text="Select Model:",
-            font=ctk.CTkFont(size=14),
-            text_color=Colors.TEXT_PRIMARY
+            font=_font(size=14),
+            text_color=self.C["TEXT_PRIMARY"]
         )
         model_label.pack(side="left")
 
@@ -388,12 +602,12 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             values=["Gemini 2.5 Pro (Best Quality)"],
             width=280,
             height=40,
-            font=ctk.CTkFont(size=13),
-            dropdown_font=ctk.CTkFont(size=13),
+            font=_font(size=13),
+            dropdown_font=_font(size=13),
             border_width=2,
-            border_color=Colors.BORDER,
-            button_color=Colors.BLUE_PRIMARY,
-            button_hover_color=Colors.BLUE_HOVER,
+            border_color=self.C["BORDER"],
+            button_color=self.C["ACCENT_PRIMARY"],
+            button_hover_color=self.C["ACCENT_HOVER"],
             corner_radius=10
         )
         self.model_dropdown.pack(side="left", padx=(15, 0))
@@ -405,8 +619,8 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         self.setup_status_label = ctk.CTkLabel(
             setup_frame,
             text="",
-            font=ctk.CTkFont(size=14),
-            text_color=Colors.TEXT_SECONDARY
+            font=_font(size=14),
+            text_color=self.C["TEXT_SECONDARY"]
         )
         self.setup_status_label.pack(pady=(0, 15))
 
@@ -419,12 +633,12 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             text="Test Connection",
             width=160,
             height=50,
-            font=ctk.CTkFont(size=15),
-            fg_color=Colors.BG_PRIMARY,
-            text_color=Colors.BLUE_PRIMARY,
+            font=_font(size=15),
+            fg_color=self.C["BG_PRIMARY"],
+            text_color=self.C["ACCENT_PRIMARY"],
             border_width=2,
-            border_color=Colors.BLUE_PRIMARY,
-            hover_color=Colors.BLUE_LIGHT,
+            border_color=self.C["ACCENT_PRIMARY"],
+            hover_color=self.C["ACCENT_LIGHT"],
             corner_radius=12,
             command=self.test_api_connection
         )
@@ -435,9 +649,9 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             text="Save & Continue",
             width=200,
             height=50,
-            font=ctk.CTkFont(size=15, weight="bold"),
-            fg_color=Colors.GREEN_PRIMARY,
-            hover_color=Colors.GREEN_HOVER,
+            font=_font(size=15, weight="bold"),
+            fg_color=self.C["SUCCESS"],
+            hover_color=self.C["SUCCESS_HOVER"],
             corner_radius=12,
             command=self.save_setup
         )
@@ -453,31 +667,30 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         # Update button styles
         for name, btn in self.provider_buttons.items():
             if name == provider_name:
-                color = Colors.PROVIDER_COLORS.get(name, Colors.BLUE_PRIMARY)
+                color = ThemeManager.PROVIDER_COLORS.get(name, self.C["ACCENT_PRIMARY"])
                 btn.configure(
                     fg_color=color,
-                    text_color=Colors.BG_PRIMARY,
+                    text_color=self.C["BG_PRIMARY"],
                     border_color=color
                 )
             else:
                 btn.configure(
-                    fg_color=Colors.BG_PRIMARY,
-                    text_color=Colors.TEXT_PRIMARY,
-                    border_color=Colors.BORDER
+                    fg_color=self.C["BG_PRIMARY"],
+                    text_color=self.C["TEXT_PRIMARY"],
+                    border_color=self.C["BORDER"]
                 )
 
         # Update help text and model dropdown
-        info = get_provider_info(provider_name)
+        info = self._provider_cache.get(provider_name)
         if info:
             self.api_help_label.configure(text=info['api_key_help'])
             self.update_model_dropdown(provider_name)
 
     def update_model_dropdown(self, provider_name: str):
         """Update the model dropdown for selected provider"""
-        info = get_provider_info(provider_name)
+        info = self._provider_cache.get(provider_name)
         if info:
-            models = list(info['models'].values())
-            self.model_dropdown.configure(values=models)
+            self.model_dropdown.configure(values=self._provider_models_list[provider_name])
             # Set default model
             default_model = info['default_model']
             if default_model in info['models']:
@@ -486,7 +699,7 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
     def get_selected_model_id(self) -> str:
         """Get the model ID from the display name"""
         provider_name = self.selected_provider.get()
-        info = get_provider_info(provider_name)
+        info = self._provider_cache.get(provider_name)
         if info:
             display_name = self.model_dropdown.get()
             for model_id, name in info['models'].items():
@@ -504,7 +717,7 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
     def open_api_key_url(self):
         """Open the API key URL in browser"""
         provider_name = self.selected_provider.get()
-        info = get_provider_info(provider_name)
+        info = self._provider_cache.get(provider_name)
         if info:
             webbrowser.open(info['api_key_url'])
 
@@ -515,29 +728,52 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         model = self.get_selected_model_id()
 
         if not api_key:
-            self.setup_status_label.configure(text="Please enter an API key", text_color=Colors.ERROR)
+            self.setup_status_label.configure(text="Please enter an API key", text_color=self.C["ERROR"])
             return
 
-        self.setup_status_label.configure(text="Testing connection...", text_color=Colors.TEXT_SECONDARY)
-        self.update()
-
-        def test():
+        self.setup_status_label.configure(text="Testing connection...", text_color=self.C["TEXT_SECONDARY"])
+
+        self._latest_test_id += 1
+        self._tests_pending += 1
+        self._test_requests.put((provider, api_key, model, self._latest_test_id))
+        if self._test_worker is None:
+            self._test_worker = threading.Thread(target=self._connection_test_worker, daemon=True)
+            self._test_worker.start()
+        if self._test_poll_job is None:
+            self._test_poll_job = self.after(50, self._poll_test_results)
+
+    def _worker_loop(self):
+        """Run queued background jobs one after another"""
+        while True:
+            job = self._work_q.get()
+            job()
+
+    def _connection_test_worker(self):
+        """Run queued connection tests and post (request id, message, color key) results"""
+        while True:
+            provider, api_key, model, test_id = self._test_requests.get()
             try:
                 provider_instance = get_provider(provider, api_key, model)
                 if provider_instance and provider_instance.test_connection():
-                    self.after(0, lambda: self.setup_status_label.configure(
-                        text="Connection successful!", text_color=Colors.SUCCESS
-                    ))
+                    result = ("Connection successful!", "SUCCESS")
                 else:
-                    self.after(0, lambda: self.setup_status_label.configure(
-                        text="Connection failed. Please check your API key.", text_color=Colors.ERROR
-                    ))
+                    result = ("Connection failed. Please check your API key.", "ERROR")
             except Exception as e:
-                self.after(0, lambda: self.setup_status_label.configure(
-                    text=f"Error: {str(e)[:60]}", text_color=Colors.ERROR
-                ))
+                result = (f"Error: {str(e)[:60]}", "ERROR")
+            self._test_results.put((test_id, *result))
 
-        threading.Thread(target=test, daemon=True).start()
+    def _poll_test_results(self):
+        """Show the result of the latest connection test; earlier ones are stale"""
+        while True:
+            try:
+                test_id, text, color = self._test_results.get_nowait()
+            except queue.Empty:
+                break
+            self._tests_pending -= 1
+            if test_id == self._latest_test_id and self.setup_status_label.winfo_exists():
+                self.setup_status_label.configure(text=text, text_color=self.C[color])
+        # Stop polling once every queued test has reported back
+        self._test_poll_job = self.after(50, self._poll_test_results) if self._tests_pending else None
 
     def save_setup(self):
         """Save the setup configuration"""
@@ -546,14 +782,14 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         model = self.get_selected_model_id()
 
         if not api_key:
-            self.setup_status_label.configure(text="Please enter an API key", text_color=Colors.ERROR)
+            self.setup_status_label.configure(text="Please enter an API key", text_color=self.C["ERROR"])
             return
 
         try:
             self.api_manager.add_provider(provider, api_key, model, set_as_default=True)
             self.show_main_view()
         except Exception as e:
-            self.setup_status_label.configure(text=f"Error saving: {str(e)}", text_color=Colors.ERROR)
+            self.setup_status_label.configure(text=f"Error saving: {str(e)}", text_color=self.C["ERROR"])
 
     # ===================== MAIN VIEW =====================
 
@@ -562,65 +798,64 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         self.clear_container()
 
         # Header bar with title, provider badge, and theme toggle
-        header_bar = ctk.CTkFrame(self.main_container, fg_color=self.theme.get("BG_PRIMARY"), height=60)
+        # The bars are plain ttk widgets colored through _apply_ttk_styles()
+        header_bar = ttk.Frame(self.main_container, style="Header.TFrame", height=60)
         header_bar.pack(fill="x")
         header_bar.pack_propagate(False)
 
-        header_content = ctk.CTkFrame(header_bar, fg_color="transparent")
+        header_content = ttk.Frame(header_bar, style="Header.TFrame")
         header_content.pack(fill="both", expand=True, padx=24)
 
         # Left side - Logo and title
-        title_label = ctk.CTkLabel(
-            header_content,
-            text="Document Summarizer",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
-        )
+        title_label = ttk.Label(header_content, text="Document Summarizer", style="Header.TLabel")
         title_label.pack(side="left", pady=15)
 
         # Right side - Provider badge and theme toggle
-        right_header = ctk.CTkFrame(header_content, fg_color="transparent")
+        right_header = ttk.Frame(header_content, style="Header.TFrame")
         right_header.pack(side="right", fill="y")
 
         # Provider badge
         provider_name = self.api_manager.get_default_provider()
         if provider_name:
-            info = get_provider_info(provider_name)
+            info = self._provider_cache.get(provider_name)
             if info:
-                provider_color = ThemeManager.PROVIDER_COLORS.get(provider_name, self.theme.get("ACCENT_PRIMARY"))
-                provider_badge = ctk.CTkFrame(right_header, fg_color=provider_color, corner_radius=6)
+                provider_color = ThemeManager.PROVIDER_COLORS.get(provider_name, self.C["ACCENT_PRIMARY"])
+                provider_badge = self._themed(ctk.CTkFrame, right_header, fg_color=provider_color,
+                                              bg_color="BG_PRIMARY", corner_radius=6)
                 provider_badge.pack(side="left", padx=(0, 12), pady=14)
 
                 provider_text = ctk.CTkLabel(
                     provider_badge,
                     text=info['display_name'],
-                    font=ctk.CTkFont(size=11, weight="bold"),
+                    font=_font(size=11, weight="bold"),
                     text_color="#FFFFFF"
                 )
                 provider_text.pack(padx=10, pady=4)
 
         # Theme toggle button
         theme_icon = "Light" if self.theme.is_dark() else "Dark"
-        self.theme_btn = ctk.CTkButton(
+        self.theme_btn = self._themed(
+            ctk.CTkButton,
             right_header,
             text=theme_icon,
             width=70,
             height=32,
-            font=ctk.CTkFont(size=12),
-            fg_color=self.theme.get("BG_TERTIARY"),
-            text_color=self.theme.get("TEXT_PRIMARY"),
-            hover_color=self.theme.get("BORDER"),
+            font=_font(size=12),
+            fg_color="BG_TERTIARY",
+            bg_color="BG_PRIMARY",
+            text_color="TEXT_PRIMARY",
+            hover_color="BORDER",
             corner_radius=8,
             command=self.toggle_theme
         )
         self.theme_btn.pack(side="left", pady=14)
 
         # Tab bar
-        tab_bar = ctk.CTkFrame(self.main_container, fg_color=self.theme.get("BG_SECONDARY"), height=50)
+        tab_bar = ttk.Frame(self.main_container, style="TabBar.TFrame", height=50)
         tab_bar.pack(fill="x")
         tab_bar.pack_propagate(False)
 
-        tab_container = ctk.CTkFrame(tab_bar, fg_color="transparent")
+        tab_container = ttk.Frame(tab_bar, style="TabBar.TFrame")
         tab_container.pack(fill="both", expand=True, padx=24)
 
         # Tab buttons
@@ -633,27 +868,22 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         ]
 
         for tab_id, tab_label in tabs:
-            is_active = self.current_tab == tab_id
-            btn = ctk.CTkButton(
+            btn = ttk.Button(
                 tab_container,
                 text=tab_label,
-                width=100,
-                height=36,
-                font=ctk.CTkFont(size=13, weight="bold" if is_active else "normal"),
-                fg_color=self.theme.get("TAB_ACTIVE") if is_active else "transparent",
-                text_color=self.theme.get("ACCENT_PRIMARY") if is_active else self.theme.get("TEXT_SECONDARY"),
-                hover_color=self.theme.get("TAB_HOVER"),
-                corner_radius=8,
-                command=lambda t=tab_id: self.switch_tab(t)
+                style="Tab.TButton",
+                takefocus=False,
+                command=partial(self.switch_tab, tab_id)
             )
             btn.pack(side="left", padx=(0, 8), pady=7)
             self.tab_buttons[tab_id] = btn
+        self._style_tab_buttons()
 
         # Divider
-        ctk.CTkFrame(self.main_container, fg_color=self.theme.get("BORDER"), height=1).pack(fill="x")
+        ttk.Frame(self.main_container, style="Divider.TFrame", height=1).pack(fill="x")
 
         # Content area
-        self.content_area = ctk.CTkFrame(self.main_container, fg_color=self.theme.get("BG_SECONDARY"))
+        self.content_area = self._themed(ctk.CTkFrame, self.main_container, fg_color="BG_SECONDARY")
         self.content_area.pack(fill="both", expand=True)
 
         # Show current tab content
@@ -662,52 +892,100 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
     def switch_tab(self, tab_id: str):
         """Switch to a different tab"""
         self.current_tab = tab_id
-
-        # Update tab button styles
+        self._style_tab_buttons()
+
+        # Show the content 50 ms later, so rapid clicks only swap in the last tab
+        if self._switch_job is not None:
+            self.after_cancel(self._switch_job)
+        self._switch_job = self.after(50, self._show_tab_content, tab_id)
+
+    def _rebuild_tab(self, tab_id: str):
+        """Discard a tab's content after its data changed, then show it rebuilt"""
+        frame = self._tab_frames.pop(tab_id, None)
+        if frame is not None:
+            frame.destroy()
+            self._themed_widgets = [(w, m) for w, m in self._themed_widgets if w.winfo_exists()]
+        self.switch_tab(tab_id)
+
+    def _style_tab_buttons(self):
+        """Highlight the active tab button"""
+        # The two styles carry the bold and regular tab fonts; only the buttons
+        # whose state changed are restyled, so the others are not remeasured
         for tid, btn in self.tab_buttons.items():
-            is_active = tid == tab_id
-            btn.configure(
-                fg_color=self.theme.get("TAB_ACTIVE") if is_active else "transparent",
-                text_color=self.theme.get("ACCENT_PRIMARY") if is_active else self.theme.get("TEXT_SECONDARY"),
-                font=ctk.CTkFont(size=13, weight="bold" if is_active else "normal")
-            )
-
-        # Clear and show new content
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-        self._show_tab_content(tab_id)
+            style = "ActiveTab.TButton" if tid == self.current_tab else "Tab.TButton"
+            if btn.cget("style") != style:
+                btn.configure(style=style)
+
+    def _apply_ttk_styles(self):
+        """Color the ttk header, tab bar and tab buttons from the current palette"""
+        style = ttk.Style(self)
+        # clam is the built-in ttk theme that honors background colors on every platform
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
+        style.configure("Header.TFrame", background=self.C["BG_PRIMARY"])
+        style.configure("Header.TLabel", background=self.C["BG_PRIMARY"],
+                        foreground=self.C["TEXT_PRIMARY"], font=_font(size=20, weight="bold"))
+        style.configure("TabBar.TFrame", background=self.C["BG_SECONDARY"])
+        style.configure("Divider.TFrame", background=self.C["BORDER"])
+        for name, bg, hover, fg, weight in (
+            ("Tab.TButton", "BG_SECONDARY", "TAB_HOVER", "TEXT_SECONDARY", "normal"),
+            ("ActiveTab.TButton", "TAB_ACTIVE", "TAB_ACTIVE", "ACCENT_PRIMARY", "bold"),
+        ):
+            style.configure(name, background=self.C[bg], foreground=self.C[fg],
+                            font=_font(size=13, weight=weight), borderwidth=0,
+                            relief="flat", padding=(20, 8))
+            style.map(name, background=[("active", self.C[hover])])
 
     def _show_tab_content(self, tab_id: str):
-        """Display content for the selected tab"""
-        if tab_id == "summarize":
-            self._create_summarize_tab()
-        elif tab_id == "output":
-            self._create_output_tab()
-        elif tab_id == "settings":
-            self._create_settings_tab()
-        elif tab_id == "help":
-            self._create_help_tab()
+        """Display content for the selected tab, building it on first visit"""
+        self._switch_job = None
+        for frame in self._tab_frames.values():
+            frame.pack_forget()
+
+        frame = self._tab_frames.get(tab_id)
+        if frame is None:
+            frame = self._tab_frames[tab_id] = self._tab_builders[tab_id]()
+        frame.pack(fill="both", expand=True, padx=24, pady=20)
 
     def toggle_theme(self):
-        """Toggle between light and dark themes"""
+        """Toggle between light and dark themes, recoloring the widgets in place"""
         self.theme.toggle_theme()
-        self.refresh_ui()
+        self.C = self.theme.palette
+        self.configure(bg=self.C["BG_PRIMARY"])
+        self.main_container.configure(fg_color=self.C["BG_PRIMARY"])
+        self._apply_ttk_styles()
+        palette = self.C
+        for widget, mapping in self._themed_widgets:
+            if widget.winfo_exists():
+                widget.configure(**{k: palette[v] for k, v in mapping.items()})
+
+        # Colors and labels that depend on state as well as on the theme
+        self.theme_btn.configure(text="Light" if self.theme.is_dark() else "Dark")
+        if "summarize" in self._tab_frames:
+            self._style_input_mode_buttons()
+        if "output" in self._tab_frames:
+            self._style_export_color_buttons()
+        if "settings" in self._tab_frames:
+            self.theme_toggle_btn.configure(
+                text=f"Switch to {'Light' if self.theme.is_dark() else 'Dark'} Mode")
+            self.current_theme_label.configure(
+                text=f"Currently: {'Dark Mode' if self.theme.is_dark() else 'Light Mode'}")
 
     def _create_summarize_tab(self):
         """Create the summarize input tab with toggle between upload and text input"""
         # Scrollable content
         scroll_frame = ctk.CTkScrollableFrame(self.content_area, fg_color="transparent")
-        scroll_frame.pack(fill="both", expand=True, padx=24, pady=20)
 
         # Input mode selection (toggle buttons)
-        mode_card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        mode_card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
         mode_card.pack(fill="x", pady=(0, 12))
 
-        mode_header = ctk.CTkLabel(
+        mode_header = self._themed(
+            ctk.CTkLabel,
             mode_card,
             text="Choose Input Method",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=14, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         mode_header.pack(pady=(16, 12), padx=20, anchor="w")
 
@@ -715,37 +993,32 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         toggle_frame = ctk.CTkFrame(mode_card, fg_color="transparent")
         toggle_frame.pack(fill="x", padx=20, pady=(0, 16))
 
-        # Initialize input mode variable
-        if not hasattr(self, 'input_mode_var'):
-            self.input_mode_var = ctk.StringVar(value="upload")
-
-        self.upload_mode_btn = ctk.CTkButton(
+        self.upload_mode_btn = self._themed(
+            ctk.CTkButton,
             toggle_frame,
             text="Upload Document",
             width=180,
             height=40,
-            font=ctk.CTkFont(size=13, weight="bold"),
-            fg_color=self.theme.get("ACCENT_PRIMARY") if self.input_mode_var.get() == "upload" else self.theme.get("INPUT_BG"),
-            text_color="#FFFFFF" if self.input_mode_var.get() == "upload" else self.theme.get("TEXT_PRIMARY"),
-            hover_color=self.theme.get("ACCENT_HOVER"),
+            font=_font(size=13, weight="bold"),
+            hover_color="ACCENT_HOVER",
             corner_radius=8,
-            command=lambda: self._switch_input_mode("upload")
+            command=partial(self._switch_input_mode, "upload")
         )
         self.upload_mode_btn.pack(side="left", padx=(0, 8))
 
-        self.text_mode_btn = ctk.CTkButton(
+        self.text_mode_btn = self._themed(
+            ctk.CTkButton,
             toggle_frame,
             text="Type Text Directly",
             width=180,
             height=40,
-            font=ctk.CTkFont(size=13, weight="bold"),
-            fg_color=self.theme.get("ACCENT_PRIMARY") if self.input_mode_var.get() == "text" else self.theme.get("INPUT_BG"),
-            text_color="#FFFFFF" if self.input_mode_var.get() == "text" else self.theme.get("TEXT_PRIMARY"),
-            hover_color=self.theme.get("ACCENT_HOVER"),
+            font=_font(size=13, weight="bold"),
+            hover_color="ACCENT_HOVER",
             corner_radius=8,
-            command=lambda: self._switch_input_mode("text")
+            command=partial(self._switch_input_mode, "text")
         )
         self.text_mode_btn.pack(side="left")
+        self._style_input_mode_buttons()
 
         # Container for input panels
         self.input_container = ctk.CTkFrame(scroll_frame, fg_color="transparent")
@@ -759,53 +1032,56 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         self._update_input_panels()
 
         # Summarize button card
-        action_card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        action_card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
         action_card.pack(fill="x")
 
         # Summarize button
-        self.summarize_btn = ctk.CTkButton(
+        self.summarize_btn = self._themed(
+            ctk.CTkButton,
             action_card,
             text="Summarize Document",
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            fg_color=self.theme.get("SUCCESS"),
-            hover_color=self.theme.get("SUCCESS_HOVER"),
+            font=_font(size=16, weight="bold"),
+            fg_color="SUCCESS",
+            hover_color="SUCCESS_HOVER",
             corner_radius=10,
             command=self.summarize_document
         )
         self.summarize_btn.pack(fill="x", padx=20, pady=20)
 
+        return scroll_frame
+
     def _create_upload_panel(self):
         """Create the upload document panel"""
-        self.upload_panel = ctk.CTkFrame(self.input_container, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        self.upload_panel = self._themed(ctk.CTkFrame, self.input_container, fg_color="CARD_BG", corner_radius=12)
 
         # Header
-        header = ctk.CTkFrame(self.upload_panel, fg_color="transparent")
-        header.pack(fill="x", padx=20, pady=(20, 12))
-
-        title = ctk.CTkLabel(
-            header,
+        title = self._themed(
+            ctk.CTkLabel,
+            self.upload_panel,
             text="Upload Document",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
-        title.pack(anchor="w")
+        title.pack(padx=20, pady=(20, 0), anchor="w")
 
-        subtitle = ctk.CTkLabel(
-            header,
+        subtitle = self._themed(
+            ctk.CTkLabel,
+            self.upload_panel,
             text="Drag and drop or browse to upload your document",
-            font=ctk.CTkFont(size=12),
-            text_color=self.theme.get("TEXT_SECONDARY")
+            font=_font(size=12),
+            text_color="TEXT_SECONDARY"
         )
-        subtitle.pack(anchor="w", pady=(4, 0))
+        subtitle.pack(padx=20, pady=(4, 12), anchor="w")
 
         # Drop zone container
-        self.drop_zone = ctk.CTkFrame(
+        self.drop_zone = self._themed(
+            ctk.CTkFrame,
             self.upload_panel,
-            fg_color=self.theme.get("INPUT_BG"),
+            fg_color="INPUT_BG",
             corner_radius=10,
             border_width=2,
-            border_color=self.theme.get("BORDER")
+            border_color="BORDER"
         )
         self.drop_zone.pack(fill="x", padx=20, pady=(0, 20))
 
@@ -820,105 +1096,120 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         # Default state - no file loaded
         self._show_empty_drop_zone()
 
+    def _clear_drop_zone(self):
+        """Destroy the drop zone's content and drop it from the themed-widget registry"""
+        children = self.drop_content.winfo_children()
+        for widget in children:
+            widget.destroy()
+        gone = {id(widget) for widget in children}
+        self._themed_widgets = [entry for entry in self._themed_widgets if id(entry[0]) not in gone]
+
     def _show_empty_drop_zone(self):
         """Show the empty drop zone state"""
         # Clear existing content
-        for widget in self.drop_content.winfo_children():
-            widget.destroy()
+        self._clear_drop_zone()
 
         # Drop icon
-        drop_icon = ctk.CTkLabel(
+        drop_icon = self._themed(
+            ctk.CTkLabel,
             self.drop_content,
             text="[ + ]",
-            font=ctk.CTkFont(size=28, weight="bold"),
-            text_color=self.theme.get("TEXT_MUTED")
+            font=_font(size=28, weight="bold"),
+            text_color="TEXT_MUTED"
         )
         drop_icon.pack()
 
-        drop_label = ctk.CTkLabel(
+        drop_label = self._themed(
+            ctk.CTkLabel,
             self.drop_content,
             text="Drop your file here",
-            font=ctk.CTkFont(size=14),
-            text_color=self.theme.get("TEXT_SECONDARY")
+            font=_font(size=14),
+            text_color="TEXT_SECONDARY"
         )
         drop_label.pack(pady=(8, 12))
 
-        browse_btn = ctk.CTkButton(
+        browse_btn = self._themed(
+            ctk.CTkButton,
             self.drop_content,
             text="Browse Files",
             width=120,
             height=36,
-            font=ctk.CTkFont(size=13),
-            fg_color=self.theme.get("ACCENT_PRIMARY"),
-            hover_color=self.theme.get("ACCENT_HOVER"),
+            font=_font(size=13),
+            fg_color="ACCENT_PRIMARY",
+            hover_color="ACCENT_HOVER",
             corner_radius=8,
             command=self.browse_file
         )
         browse_btn.pack()
 
-        formats_label = ctk.CTkLabel(
+        formats_label = self._themed(
+            ctk.CTkLabel,
             self.drop_content,
             text="Supports PDF, DOCX, TXT",
-            font=ctk.CTkFont(size=11),
-            text_color=self.theme.get("TEXT_MUTED")
+            font=_font(size=11),
+            text_color="TEXT_MUTED"
         )
         formats_label.pack(pady=(10, 0))
 
     def _show_loaded_file_drop_zone(self, filename: str, char_count: int = 0):
         """Show the loaded file state in the drop zone"""
         # Clear existing content
-        for widget in self.drop_content.winfo_children():
-            widget.destroy()
+        self._clear_drop_zone()
 
         # Success icon
-        success_icon = ctk.CTkLabel(
+        success_icon = self._themed(
+            ctk.CTkLabel,
             self.drop_content,
             text="✓",
-            font=ctk.CTkFont(size=36, weight="bold"),
-            text_color=self.theme.get("SUCCESS")
+            font=_font(size=36, weight="bold"),
+            text_color="SUCCESS"
         )
         success_icon.pack()
 
         # File loaded label
-        loaded_label = ctk.CTkLabel(
+        loaded_label = self._themed(
+            ctk.CTkLabel,
             self.drop_content,
             text="Document Loaded",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=self.theme.get("SUCCESS")
+            font=_font(size=14, weight="bold"),
+            text_color="SUCCESS"
         )
         loaded_label.pack(pady=(8, 4))
 
         # Filename
-        filename_label = ctk.CTkLabel(
+        filename_label = self._themed(
+            ctk.CTkLabel,
             self.drop_content,
             text=filename,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         filename_label.pack()
 
         # Character count if available
         if char_count > 0:
-            char_label = ctk.CTkLabel(
+            char_label = self._themed(
+                ctk.CTkLabel,
                 self.drop_content,
                 text=f"{char_count:,} characters extracted",
-                font=ctk.CTkFont(size=12),
-                text_color=self.theme.get("TEXT_SECONDARY")
+                font=_font(size=12),
+                text_color="TEXT_SECONDARY"
             )
             char_label.pack(pady=(4, 12))
         else:
             ctk.CTkFrame(self.drop_content, fg_color="transparent", height=12).pack()
 
         # Change file button
-        change_btn = ctk.CTkButton(
+        change_btn = self._themed(
+            ctk.CTkButton,
             self.drop_content,
             text="Change File",
             width=120,
             height=32,
-            font=ctk.CTkFont(size=12),
-            fg_color=self.theme.get("BG_TERTIARY"),
-            text_color=self.theme.get("TEXT_PRIMARY"),
-            hover_color=self.theme.get("BORDER"),
+            font=_font(size=12),
+            fg_color="BG_TERTIARY",
+            text_color="TEXT_PRIMARY",
+            hover_color="BORDER",
             corner_radius=8,
             command=self.browse_file
         )
@@ -926,47 +1217,48 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
 
     def _create_text_panel(self):
         """Create the text input panel"""
-        self.text_panel = ctk.CTkFrame(self.input_container, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        self.text_panel = self._themed(ctk.CTkFrame, self.input_container, fg_color="CARD_BG", corner_radius=12)
 
         # Header
-        header = ctk.CTkFrame(self.text_panel, fg_color="transparent")
-        header.pack(fill="x", padx=20, pady=(20, 12))
-
-        title = ctk.CTkLabel(
-            header,
+        title = self._themed(
+            ctk.CTkLabel,
+            self.text_panel,
             text="Type or Paste Text",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
-        title.pack(anchor="w")
+        title.pack(padx=20, pady=(20, 0), anchor="w")
 
-        subtitle = ctk.CTkLabel(
-            header,
+        subtitle = self._themed(
+            ctk.CTkLabel,
+            self.text_panel,
             text="Enter the text you want to summarize",
-            font=ctk.CTkFont(size=12),
-            text_color=self.theme.get("TEXT_SECONDARY")
+            font=_font(size=12),
+            text_color="TEXT_SECONDARY"
         )
-        subtitle.pack(anchor="w", pady=(4, 0))
+        subtitle.pack(padx=20, pady=(4, 12), anchor="w")
 
         # Text input
-        self.text_input = ctk.CTkTextbox(
+        self.text_input = self._themed(
+            ctk.CTkTextbox,
             self.text_panel,
             height=200,
-            font=ctk.CTkFont(size=13),
-            fg_color=self.theme.get("INPUT_BG"),
-            text_color=self.theme.get("TEXT_PRIMARY"),
+            font=_font(size=13),
+            fg_color="INPUT_BG",
+            text_color="TEXT_PRIMARY",
             border_width=1,
-            border_color=self.theme.get("BORDER"),
+            border_color="BORDER",
             corner_radius=8
         )
         self.text_input.pack(fill="x", padx=20, pady=(0, 12))
 
         # Character count hint
-        hint_label = ctk.CTkLabel(
+        hint_label = self._themed(
+            ctk.CTkLabel,
             self.text_panel,
             text="Minimum 50 characters required for summarization",
-            font=ctk.CTkFont(size=11),
-            text_color=self.theme.get("TEXT_MUTED")
+            font=_font(size=11),
+            text_color="TEXT_MUTED"
         )
         hint_label.pack(padx=20, anchor="w", pady=(0, 20))
 
@@ -974,24 +1266,26 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         """Switch between upload and text input modes"""
         self.input_mode_var.set(mode)
         self._update_input_panels()
+        self._style_input_mode_buttons()
 
-        # Update toggle button styles
-        if mode == "upload":
+    def _style_input_mode_buttons(self):
+        """Highlight the button of the current input mode"""
+        if self.input_mode_var.get() == "upload":
             self.upload_mode_btn.configure(
-                fg_color=self.theme.get("ACCENT_PRIMARY"),
+                fg_color=self.C["ACCENT_PRIMARY"],
                 text_color="#FFFFFF"
             )
             self.text_mode_btn.configure(
-                fg_color=self.theme.get("INPUT_BG"),
-                text_color=self.theme.get("TEXT_PRIMARY")
+                fg_color=self.C["INPUT_BG"],
+                text_color=self.C["TEXT_PRIMARY"]
             )
         else:
             self.upload_mode_btn.configure(
-                fg_color=self.theme.get("INPUT_BG"),
-                text_color=self.theme.get("TEXT_PRIMARY")
+                fg_color=self.C["INPUT_BG"],
+                text_color=self.C["TEXT_PRIMARY"]
             )
             self.text_mode_btn.configure(
-                fg_color=self.theme.get("ACCENT_PRIMARY"),
+                fg_color=self.C["ACCENT_PRIMARY"],
                 text_color="#FFFFFF"
             )
 
@@ -1012,45 +1306,71 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
     def _create_output_tab(self):
         """Create the output/results tab"""
         scroll_frame = ctk.CTkScrollableFrame(self.content_area, fg_color="transparent")
-        scroll_frame.pack(fill="both", expand=True, padx=24, pady=20)
 
         # Output card
-        card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
         card.pack(fill="x", pady=(0, 16))
 
         # Header
-        header = ctk.CTkFrame(card, fg_color="transparent")
-        header.pack(fill="x", padx=20, pady=(20, 12))
-
-        title = ctk.CTkLabel(
-            header,
+        title = self._themed(
+            ctk.CTkLabel,
+            card,
             text="Summary Output",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
-        title.pack(side="left")
+        title.pack(padx=20, pady=(20, 12), anchor="w")
 
         # Status label
-        self.status_label = ctk.CTkLabel(
+        self.status_label = self._themed(
+            ctk.CTkLabel,
             card,
             text="No summary generated yet. Go to the Summarize tab to create one.",
-            font=ctk.CTkFont(size=12),
-            text_color=self.theme.get("TEXT_SECONDARY")
+            font=_font(size=12),
+            text_color="TEXT_SECONDARY"
         )
         self.status_label.pack(padx=20, anchor="w", pady=(0, 12))
 
-        # Summary output textbox
-        self.summary_output = ctk.CTkTextbox(
+        # Summary output: a plain Text in a rounded frame, which inserts long
+        # summaries faster than CTkTextbox and its canvas-drawn border
+        output_frame = self._themed(
+            ctk.CTkFrame,
             card,
-            font=ctk.CTkFont(size=13),
-            fg_color=self.theme.get("INPUT_BG"),
-            text_color=self.theme.get("TEXT_PRIMARY"),
+            fg_color="INPUT_BG",
             border_width=1,
-            border_color=self.theme.get("BORDER"),
+            border_color="BORDER",
             corner_radius=8,
             height=280
         )
-        self.summary_output.pack(fill="both", expand=True, padx=20, pady=(0, 16))
+        output_frame.pack(fill="both", expand=True, padx=20, pady=(0, 16))
+        output_frame.pack_propagate(False)
+
+        self.summary_output = tk.Text(
+            output_frame,
+            font=_font(size=13),
+            bg=self.C["INPUT_BG"],
+            fg=self.C["TEXT_PRIMARY"],
+            insertbackground=self.C["TEXT_PRIMARY"],
+            bd=0,
+            highlightthickness=0,
+            wrap="word",
+            undo=False,
+            maxundo=0
+        )
+        self._themed_widgets.append((self.summary_output, {
+            "bg": "INPUT_BG", "fg": "TEXT_PRIMARY", "insertbackground": "TEXT_PRIMARY"}))
+
+        output_scrollbar = self._themed(
+            ctk.CTkScrollbar,
+            output_frame,
+            command=self.summary_output.yview,
+            fg_color="INPUT_BG",
+            button_color="BORDER",
+            button_hover_color="TEXT_MUTED"
+        )
+        output_scrollbar.pack(side="right", fill="y", padx=(0, 4), pady=6)
+        self.summary_output.configure(yscrollcommand=output_scrollbar.set)
+        self.summary_output.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=8)
 
         # Display existing summary if available
         if self.current_summary:
@@ -1061,22 +1381,24 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         ctk.CTkFrame(card, fg_color="transparent", height=8).pack()
 
         # Export Options Card
-        export_card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        export_card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
         export_card.pack(fill="x")
 
-        export_header = ctk.CTkLabel(
+        export_header = self._themed(
+            ctk.CTkLabel,
             export_card,
             text="Export Options",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         export_header.pack(pady=(20, 4), padx=20, anchor="w")
 
-        export_subtitle = ctk.CTkLabel(
+        export_subtitle = self._themed(
+            ctk.CTkLabel,
             export_card,
             text="Customize how your exported document looks",
-            font=ctk.CTkFont(size=12),
-            text_color=self.theme.get("TEXT_SECONDARY")
+            font=_font(size=12),
+            text_color="TEXT_SECONDARY"
         )
         export_subtitle.pack(padx=20, anchor="w", pady=(0, 16))
 
@@ -1084,294 +1406,234 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         format_section = ctk.CTkFrame(export_card, fg_color="transparent")
         format_section.pack(fill="x", padx=20, pady=(0, 12))
 
-        format_label = ctk.CTkLabel(
+        format_label = self._themed(
+            ctk.CTkLabel,
             format_section,
             text="File Format:",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=13, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         format_label.pack(side="left")
 
-        self.export_format_var = ctk.StringVar(value="pdf")
-
-        pdf_radio = ctk.CTkRadioButton(
+        pdf_radio = self._themed(
+            ctk.CTkRadioButton,
             format_section,
             text="PDF",
             variable=self.export_format_var,
             value="pdf",
-            font=ctk.CTkFont(size=12),
-            fg_color=self.theme.get("ACCENT_PRIMARY"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=12),
+            fg_color="ACCENT_PRIMARY",
+            text_color="TEXT_PRIMARY"
         )
         pdf_radio.pack(side="left", padx=(16, 12))
 
-        word_radio = ctk.CTkRadioButton(
+        word_radio = self._themed(
+            ctk.CTkRadioButton,
             format_section,
             text="Word Document",
             variable=self.export_format_var,
             value="word",
-            font=ctk.CTkFont(size=12),
-            fg_color=self.theme.get("ACCENT_PRIMARY"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=12),
+            fg_color="ACCENT_PRIMARY",
+            text_color="TEXT_PRIMARY"
         )
         word_radio.pack(side="left")
 
         # Divider
-        ctk.CTkFrame(export_card, fg_color=self.theme.get("BORDER"), height=1).pack(fill="x", padx=20, pady=12)
+        self._themed(ctk.CTkFrame, export_card, fg_color="BORDER", height=1).pack(fill="x", padx=20, pady=12)
 
         # Document Style Selection
-        style_label = ctk.CTkLabel(
+        style_label = self._themed(
+            ctk.CTkLabel,
             export_card,
             text="Document Style:",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=13, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         style_label.pack(padx=20, anchor="w", pady=(0, 12))
 
-        self.export_style_var = ctk.StringVar(value="professional")
-
         # Style options grid
         styles_frame = ctk.CTkFrame(export_card, fg_color="transparent")
         styles_frame.pack(fill="x", padx=20, pady=(0, 16))
 
-        style_options = [
-            ("professional", "Professional", "Clean layout with headers and structured paragraphs"),
-            ("bullet_points", "Bullet Points", "Key points as a bulleted list for quick reading"),
-            ("numbered_list", "Numbered List", "Organized numbered sections for easy reference"),
-            ("executive", "Executive Summary", "Concise highlights with bold key takeaways"),
-            ("detailed", "Detailed Report", "Comprehensive format with sections and subsections"),
-            ("minimalist", "Minimalist", "Simple, clean text with minimal formatting"),
-        ]
-
-        for i, (value, label, description) in enumerate(style_options):
-            style_option = ctk.CTkFrame(styles_frame, fg_color=self.theme.get("INPUT_BG"), corner_radius=8)
+        for value, label, description in _STYLE_OPTIONS:
+            style_option = self._themed(ctk.CTkFrame, styles_frame, fg_color="INPUT_BG", corner_radius=8)
             style_option.pack(fill="x", pady=4)
 
-            radio = ctk.CTkRadioButton(
+            radio = self._themed(
+                ctk.CTkRadioButton,
                 style_option,
                 text="",
                 variable=self.export_style_var,
                 value=value,
                 width=20,
-                fg_color=self.theme.get("ACCENT_PRIMARY"),
-                command=lambda v=value: self.export_style_var.set(v)
+                fg_color="ACCENT_PRIMARY",
+                command=partial(self.export_style_var.set, value)
             )
             radio.pack(side="left", padx=(12, 8), pady=10)
 
             text_frame = ctk.CTkFrame(style_option, fg_color="transparent")
             text_frame.pack(side="left", fill="x", expand=True, pady=8)
 
-            style_name = ctk.CTkLabel(
+            style_name = self._themed(
+                ctk.CTkLabel,
                 text_frame,
                 text=label,
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=self.theme.get("TEXT_PRIMARY"),
+                font=_font(size=13, weight="bold"),
+                text_color="TEXT_PRIMARY",
                 anchor="w"
             )
             style_name.pack(anchor="w")
 
-            style_desc = ctk.CTkLabel(
+            style_desc = self._themed(
+                ctk.CTkLabel,
                 text_frame,
                 text=description,
-                font=ctk.CTkFont(size=11),
-                text_color=self.theme.get("TEXT_MUTED"),
+                font=_font(size=11),
+                text_color="TEXT_MUTED",
                 anchor="w"
             )
             style_desc.pack(anchor="w")
 
-            # Make the whole row clickable
-            style_option.bind("<Button-1>", lambda e, v=value: self.export_style_var.set(v))
-            text_frame.bind("<Button-1>", lambda e, v=value: self.export_style_var.set(v))
-            style_name.bind("<Button-1>", lambda e, v=value: self.export_style_var.set(v))
-            style_desc.bind("<Button-1>", lambda e, v=value: self.export_style_var.set(v))
+            # Make the whole row clickable through the shared StyleRow binding
+            style_option._style_value = value
+            self._add_bindtag(style_option, "StyleRow")
 
         # Divider
-        ctk.CTkFrame(export_card, fg_color=self.theme.get("BORDER"), height=1).pack(fill="x", padx=20, pady=12)
+        self._themed(ctk.CTkFrame, export_card, fg_color="BORDER", height=1).pack(fill="x", padx=20, pady=12)
 
         # Color Scheme Selection
-        color_label = ctk.CTkLabel(
+        color_label = self._themed(
+            ctk.CTkLabel,
             export_card,
             text="Color Scheme:",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=13, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         color_label.pack(padx=20, anchor="w", pady=(0, 12))
 
-        self.export_color_var = ctk.StringVar(value="blue")
-
         colors_frame = ctk.CTkFrame(export_card, fg_color="transparent")
         colors_frame.pack(fill="x", padx=20, pady=(0, 16))
 
-        color_options = [
-            ("blue", "Blue", "#2563EB"),
-            ("green", "Green", "#059669"),
-            ("purple", "Purple", "#7C3AED"),
-            ("red", "Red", "#DC2626"),
-            ("orange", "Orange", "#EA580C"),
-            ("gray", "Grayscale", "#475569"),
-        ]
-
-        for value, label, color in color_options:
+        selected = self._selected_color = self.export_color_var.get()
+        input_bg, text_primary = self.C["INPUT_BG"], self.C["TEXT_PRIMARY"]
+        self.color_buttons = {}
+        for value, label, color in _COLOR_OPTIONS:
             color_btn = ctk.CTkButton(
                 colors_frame,
                 text=label,
                 width=80,
                 height=36,
-                font=ctk.CTkFont(size=11),
-                fg_color=color if self.export_color_var.get() == value else self.theme.get("INPUT_BG"),
-                text_color="#FFFFFF" if self.export_color_var.get() == value else self.theme.get("TEXT_PRIMARY"),
+                font=_font(size=11),
+                fg_color=color if selected == value else input_bg,
+                text_color="#FFFFFF" if selected == value else text_primary,
                 hover_color=color,
                 corner_radius=8,
-                command=lambda v=value: self._select_export_color(v)
+                command=partial(self._select_export_color, value)
             )
             color_btn.pack(side="left", padx=(0, 8))
             # Store reference for updating
-            if not hasattr(self, 'color_buttons'):
-                self.color_buttons = {}
             self.color_buttons[value] = (color_btn, color)
 
         # Export button
-        self.export_btn = ctk.CTkButton(
+        self.export_btn = self._themed(
+            ctk.CTkButton,
             export_card,
             text="Export Summary",
             height=48,
-            font=ctk.CTkFont(size=15, weight="bold"),
-            fg_color=self.theme.get("SUCCESS"),
-            hover_color=self.theme.get("SUCCESS_HOVER"),
+            font=_font(size=15, weight="bold"),
+            fg_color="SUCCESS",
+            hover_color="SUCCESS_HOVER",
             corner_radius=10,
             state="normal" if self.current_summary else "disabled",
             command=self.export_summary
         )
         self.export_btn.pack(fill="x", padx=20, pady=(8, 20))
 
+        return scroll_frame
+
+    def _add_bindtag(self, widget, tag: str):
+        """Add a bindtag to a widget and the Tk widgets it is drawn with"""
+        widget.bindtags(widget.bindtags() + (tag,))
+        for child in widget.winfo_children():
+            self._add_bindtag(child, tag)
+
+    def _on_style_row_click(self, event):
+        """Select the export style of the clicked row"""
+        widget = event.widget
+        while widget is not None and not hasattr(widget, "_style_value"):
+            widget = widget.master
+        if widget is not None:
+            self.export_style_var.set(widget._style_value)
+
     def _select_export_color(self, color_value: str):
         """Handle color scheme selection"""
         self.export_color_var.set(color_value)
-        # Update button styles
+        if color_value == self._selected_color:
+            return
+        # Only the previous and the new selection change color
+        btn, _ = self.color_buttons[self._selected_color]
+        btn.configure(fg_color=self.C["INPUT_BG"], text_color=self.C["TEXT_PRIMARY"])
+        btn, color = self.color_buttons[color_value]
+        btn.configure(fg_color=color, text_color="#FFFFFF")
+        self._selected_color = color_value
+
+    def _style_export_color_buttons(self):
+        """Recolor every color scheme button for the current theme"""
+        input_bg, text_primary = self.C["INPUT_BG"], self.C["TEXT_PRIMARY"]
         for value, (btn, color) in self.color_buttons.items():
-            if value == color_value:
+            if value == self._selected_color:
                 btn.configure(fg_color=color, text_color="#FFFFFF")
             else:
-                btn.configure(fg_color=self.theme.get("INPUT_BG"), text_color=self.theme.get("TEXT_PRIMARY"))
+                btn.configure(fg_color=input_bg, text_color=text_primary)
 
     def _create_settings_tab(self):
         """Create the settings tab"""
         scroll_frame = ctk.CTkScrollableFrame(self.content_area, fg_color="transparent")
-        scroll_frame.pack(fill="both", expand=True, padx=24, pady=20)
 
         # Configured providers card
-        providers_card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        providers_card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
         providers_card.pack(fill="x", pady=(0, 16))
 
-        providers_header = ctk.CTkLabel(
+        providers_header = self._themed(
+            ctk.CTkLabel,
             providers_card,
             text="Configured AI Providers",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         providers_header.pack(pady=(20, 12), padx=20, anchor="w")
 
+        self._providers_card = providers_card
+        self._provider_rows = {}
+        self._no_providers_label = None
         providers = self.api_manager.list_providers()
 
-        if providers:
-            for prov in providers:
-                prov_frame = ctk.CTkFrame(providers_card, fg_color=self.theme.get("INPUT_BG"), corner_radius=8)
-                prov_frame.pack(fill="x", padx=20, pady=4)
-
-                info = get_provider_info(prov['name'])
-                color = ThemeManager.PROVIDER_COLORS.get(prov['name'], self.theme.get("ACCENT_PRIMARY"))
-
-                # Provider color indicator
-                color_bar = ctk.CTkFrame(prov_frame, fg_color=color, width=4, corner_radius=2)
-                color_bar.pack(side="left", fill="y", padx=(0, 12), pady=8)
-
-                details = ctk.CTkFrame(prov_frame, fg_color="transparent")
-                details.pack(side="left", fill="x", expand=True, pady=10)
-
-                name_row = ctk.CTkFrame(details, fg_color="transparent")
-                name_row.pack(fill="x")
-
-                name_label = ctk.CTkLabel(
-                    name_row,
-                    text=info['display_name'] if info else prov['name'],
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    text_color=self.theme.get("TEXT_PRIMARY")
-                )
-                name_label.pack(side="left")
-
-                if prov['is_default']:
-                    default_badge = ctk.CTkLabel(
-                        name_row,
-                        text="DEFAULT",
-                        font=ctk.CTkFont(size=9, weight="bold"),
-                        text_color="#FFFFFF",
-                        fg_color=self.theme.get("SUCCESS"),
-                        corner_radius=4
-                    )
-                    default_badge.pack(side="left", padx=8)
-
-                model_name = "Default model"
-                if prov['model'] and info:
-                    model_name = info['models'].get(prov['model'], prov['model'])
-
-                model_label = ctk.CTkLabel(
-                    details,
-                    text=f"Model: {model_name}  |  Key: {prov['api_key_preview']}",
-                    font=ctk.CTkFont(size=11),
-                    text_color=self.theme.get("TEXT_SECONDARY")
-                )
-                model_label.pack(anchor="w")
-
-                # Action buttons
-                actions = ctk.CTkFrame(prov_frame, fg_color="transparent")
-                actions.pack(side="right", padx=12, pady=10)
-
-                if not prov['is_default']:
-                    set_default_btn = ctk.CTkButton(
-                        actions,
-                        text="Set Default",
-                        width=80,
-                        height=28,
-                        font=ctk.CTkFont(size=11),
-                        fg_color=self.theme.get("ACCENT_PRIMARY"),
-                        hover_color=self.theme.get("ACCENT_HOVER"),
-                        corner_radius=6,
-                        command=lambda p=prov['name']: self._set_default(p)
-                    )
-                    set_default_btn.pack(side="left", padx=(0, 6))
-
-                remove_btn = ctk.CTkButton(
-                    actions,
-                    text="Remove",
-                    width=70,
-                    height=28,
-                    font=ctk.CTkFont(size=11),
-                    fg_color=self.theme.get("ERROR"),
-                    hover_color="#DC2626",
-                    corner_radius=6,
-                    command=lambda p=prov['name']: self._remove_provider(p)
-                )
-                remove_btn.pack(side="left")
-        else:
-            no_providers = ctk.CTkLabel(
+        if not providers:
+            self._no_providers_label = self._themed(
+                ctk.CTkLabel,
                 providers_card,
                 text="No providers configured. Add one below.",
-                font=ctk.CTkFont(size=13),
-                text_color=self.theme.get("TEXT_SECONDARY")
+                font=_font(size=13),
+                text_color="TEXT_SECONDARY"
             )
-            no_providers.pack(pady=16)
+            self._no_providers_label.pack(pady=16)
 
-        ctk.CTkFrame(providers_card, fg_color="transparent", height=16).pack()
+        # Provider rows are packed above this spacer
+        self._providers_spacer = ctk.CTkFrame(providers_card, fg_color="transparent", height=16)
+        self._providers_spacer.pack()
+        self._sync_provider_rows(providers)
 
         # Add new provider card
-        add_card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        add_card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
         add_card.pack(fill="x", pady=(0, 16))
 
-        add_header = ctk.CTkLabel(
+        add_header = self._themed(
+            ctk.CTkLabel,
             add_card,
             text="Add New Provider",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         add_header.pack(pady=(20, 12), padx=20, anchor="w")
 
@@ -1381,17 +1643,18 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
 
         self.new_provider_var = ctk.StringVar(value="gemini")
 
-        all_providers = get_all_providers()
+        all_providers = self._provider_cache
         col = 0
         for name, info in all_providers.items():
-            rb = ctk.CTkRadioButton(
+            rb = self._themed(
+                ctk.CTkRadioButton,
                 provider_select_frame,
                 text=info['display_name'],
                 variable=self.new_provider_var,
                 value=name,
-                font=ctk.CTkFont(size=12),
-                fg_color=self.theme.get("ACCENT_PRIMARY"),
-                text_color=self.theme.get("TEXT_PRIMARY")
+                font=_font(size=12),
+                fg_color="ACCENT_PRIMARY",
+                text_color="TEXT_PRIMARY"
             )
             rb.grid(row=0, column=col, padx=8, pady=4, sticky="w")
             col += 1
@@ -1400,168 +1663,230 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         input_frame = ctk.CTkFrame(add_card, fg_color="transparent")
         input_frame.pack(fill="x", padx=20, pady=(0, 20))
 
-        self.new_api_key_entry = ctk.CTkEntry(
+        self.new_api_key_entry = self._themed(
+            ctk.CTkEntry,
             input_frame,
             placeholder_text="Enter API key...",
             width=320,
             height=40,
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             show="*",
             border_width=1,
-            border_color=self.theme.get("BORDER"),
-            fg_color=self.theme.get("INPUT_BG"),
-            text_color=self.theme.get("TEXT_PRIMARY"),
+            border_color="BORDER",
+            fg_color="INPUT_BG",
+            text_color="TEXT_PRIMARY",
             corner_radius=8
         )
         self.new_api_key_entry.pack(side="left", padx=(0, 10))
 
-        add_btn = ctk.CTkButton(
+        add_btn = self._themed(
+            ctk.CTkButton,
             input_frame,
             text="Add Provider",
             width=110,
             height=40,
-            font=ctk.CTkFont(size=13),
-            fg_color=self.theme.get("SUCCESS"),
-            hover_color=self.theme.get("SUCCESS_HOVER"),
+            font=_font(size=13),
+            fg_color="SUCCESS",
+            hover_color="SUCCESS_HOVER",
             corner_radius=8,
             command=self._add_provider
         )
         add_btn.pack(side="left")
 
         # Theme settings card
-        theme_card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        theme_card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
         theme_card.pack(fill="x")
 
-        theme_header = ctk.CTkLabel(
+        theme_header = self._themed(
+            ctk.CTkLabel,
             theme_card,
             text="Appearance",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         theme_header.pack(pady=(20, 12), padx=20, anchor="w")
 
         theme_row = ctk.CTkFrame(theme_card, fg_color="transparent")
         theme_row.pack(fill="x", padx=20, pady=(0, 20))
 
-        theme_label = ctk.CTkLabel(
+        theme_label = self._themed(
+            ctk.CTkLabel,
             theme_row,
             text="Theme:",
-            font=ctk.CTkFont(size=13),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=13),
+            text_color="TEXT_PRIMARY"
         )
         theme_label.pack(side="left")
 
         current_theme_text = "Dark Mode" if self.theme.is_dark() else "Light Mode"
-        theme_toggle_btn = ctk.CTkButton(
+        self.theme_toggle_btn = self._themed(
+            ctk.CTkButton,
             theme_row,
             text=f"Switch to {'Light' if self.theme.is_dark() else 'Dark'} Mode",
             width=160,
             height=36,
-            font=ctk.CTkFont(size=12),
-            fg_color=self.theme.get("BG_TERTIARY"),
-            text_color=self.theme.get("TEXT_PRIMARY"),
-            hover_color=self.theme.get("BORDER"),
+            font=_font(size=12),
+            fg_color="BG_TERTIARY",
+            text_color="TEXT_PRIMARY",
+            hover_color="BORDER",
             corner_radius=8,
             command=self.toggle_theme
         )
-        theme_toggle_btn.pack(side="left", padx=(12, 0))
+        self.theme_toggle_btn.pack(side="left", padx=(12, 0))
 
-        current_label = ctk.CTkLabel(
+        self.current_theme_label = self._themed(
+            ctk.CTkLabel,
             theme_row,
             text=f"Currently: {current_theme_text}",
-            font=ctk.CTkFont(size=11),
-            text_color=self.theme.get("TEXT_MUTED")
+            font=_font(size=11),
+            text_color="TEXT_MUTED"
+        )
+        self.current_theme_label.pack(side="left", padx=(12, 0))
+
+        return scroll_frame
+
+    def _build_provider_row(self, prov: dict):
+        """Build the settings row for one configured provider (not packed)"""
+        prov_frame = self._themed(ctk.CTkFrame, self._providers_card, fg_color="INPUT_BG", corner_radius=8)
+
+        info = self._provider_cache.get(prov['name'])
+        color = ThemeManager.PROVIDER_COLORS.get(prov['name'], self.C["ACCENT_PRIMARY"])
+
+        # Provider color indicator
+        color_bar = ctk.CTkFrame(prov_frame, fg_color=color, width=4, corner_radius=2)
+        color_bar.pack(side="left", fill="y", padx=(0, 12), pady=8)
+
+        details = ctk.CTkFrame(prov_frame, fg_color="transparent")
+        details.pack(side="left", fill="x", expand=True, pady=10)
+
+        name_row = ctk.CTkFrame(details, fg_color="transparent")
+        name_row.pack(fill="x")
+
+        name_label = self._themed(
+            ctk.CTkLabel,
+            name_row,
+            text=info['display_name'] if info else prov['name'],
+            font=_font(size=14, weight="bold"),
+            text_color="TEXT_PRIMARY"
+        )
+        name_label.pack(side="left")
+
+        if prov['is_default']:
+            default_badge = self._themed(
+                ctk.CTkLabel,
+                name_row,
+                text="DEFAULT",
+                font=_font(size=9, weight="bold"),
+                text_color="#FFFFFF",
+                fg_color="SUCCESS",
+                corner_radius=4
+            )
+            default_badge.pack(side="left", padx=8)
+
+        model_name = "Default model"
+        if prov['model'] and info:
+            model_name = info['models'].get(prov['model'], prov['model'])
+
+        model_label = self._themed(
+            ctk.CTkLabel,
+            details,
+            text=f"Model: {model_name}  |  Key: {prov['api_key_preview']}",
+            font=_font(size=11),
+            text_color="TEXT_SECONDARY"
+        )
+        model_label.pack(anchor="w")
+
+        # Action buttons
+        actions = ctk.CTkFrame(prov_frame, fg_color="transparent")
+        actions.pack(side="right", padx=12, pady=10)
+
+        if not prov['is_default']:
+            set_default_btn = self._themed(
+                ctk.CTkButton,
+                actions,
+                text="Set Default",
+                width=80,
+                height=28,
+                font=_font(size=11),
+                fg_color="ACCENT_PRIMARY",
+                hover_color="ACCENT_HOVER",
+                corner_radius=6,
+                command=partial(self._set_default, prov['name'])
+            )
+            set_default_btn.pack(side="left", padx=(0, 6))
+
+        remove_btn = self._themed(
+            ctk.CTkButton,
+            actions,
+            text="Remove",
+            width=70,
+            height=28,
+            font=_font(size=11),
+            fg_color="ERROR",
+            hover_color="#DC2626",
+            corner_radius=6,
+            command=partial(self._remove_provider, prov['name'])
         )
-        current_label.pack(side="left", padx=(12, 0))
+        remove_btn.pack(side="left")
+
+        return prov_frame
+
+    def _sync_provider_rows(self, providers=None):
+        """Update the settings tab's provider rows in place: only new, changed or removed rows are touched"""
+        if providers is None:
+            providers = self.api_manager.list_providers()
+        if providers and self._no_providers_label is not None:
+            self._no_providers_label.destroy()
+            self._no_providers_label = None
+
+        names = {prov['name'] for prov in providers}
+        for name in [name for name in self._provider_rows if name not in names]:
+            self._provider_rows.pop(name)[0].destroy()
+
+        for prov in providers:
+            state = (prov['is_default'], prov['model'], prov['api_key_preview'])
+            row = self._provider_rows.get(prov['name'])
+            if row is None or row[1] != state:
+                if row is not None:
+                    row[0].destroy()
+                row = self._provider_rows[prov['name']] = (self._build_provider_row(prov), state)
+            # Re-packing keeps the rows in list order above the spacer
+            row[0].pack(fill="x", padx=20, pady=4, before=self._providers_spacer)
+
+        self._themed_widgets = [(w, m) for w, m in self._themed_widgets if w.winfo_exists()]
 
     def _create_help_tab(self):
         """Create the help tab with API key instructions"""
         scroll_frame = ctk.CTkScrollableFrame(self.content_area, fg_color="transparent")
-        scroll_frame.pack(fill="both", expand=True, padx=24, pady=20)
+        # Step lists are built the first time a card is expanded
+        self._help_steps = {}
 
         # Intro card
-        intro_card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        intro_card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
         intro_card.pack(fill="x", pady=(0, 16))
 
-        intro_header = ctk.CTkLabel(
+        intro_header = self._themed(
+            ctk.CTkLabel,
             intro_card,
             text="Getting Started",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.theme.get("TEXT_PRIMARY")
+            font=_font(size=16, weight="bold"),
+            text_color="TEXT_PRIMARY"
         )
         intro_header.pack(pady=(20, 8), padx=20, anchor="w")
 
-        intro_text = ctk.CTkLabel(
+        intro_text = self._themed(
+            ctk.CTkLabel,
             intro_card,
             text="To use Document Summarizer, you need an API key from one of the supported AI providers.\nBelow are instructions for getting a free or paid API key from each provider.",
-            font=ctk.CTkFont(size=12),
-            text_color=self.theme.get("TEXT_SECONDARY"),
+            font=_font(size=12),
+            text_color="TEXT_SECONDARY",
             justify="left"
         )
         intro_text.pack(padx=20, pady=(0, 20), anchor="w")
 
         # Provider help cards
-        providers_info = [
-            {
-                "name": "Google Gemini",
-                "color": ThemeManager.PROVIDER_COLORS["gemini"],
-                "free": True,
-                "url": "https://aistudio.google.com/app/apikey",
-                "steps": [
-                    "1. Go to Google AI Studio (aistudio.google.com)",
-                    "2. Sign in with your Google account",
-                    "3. Click 'Get API Key' in the sidebar",
-                    "4. Create a new API key",
-                    "5. Copy and paste it here"
-                ],
-                "notes": "Free tier: 15 requests/minute. Recommended for most users!"
-            },
-            {
-                "name": "OpenAI (GPT)",
-                "color": ThemeManager.PROVIDER_COLORS["openai"],
-                "free": False,
-                "url": "https://platform.openai.com/api-keys",
-                "steps": [
-                    "1. Go to platform.openai.com",
-                    "2. Sign up or log in",
-                    "3. Navigate to API Keys",
-                    "4. Create a new secret key",
-                    "5. Add a payment method"
-                ],
-                "notes": "Paid only. Requires billing setup."
-            },
-            {
-                "name": "Anthropic Claude",
-                "color": ThemeManager.PROVIDER_COLORS["claude"],
-                "free": False,
-                "url": "https://console.anthropic.com/settings/keys",
-                "steps": [
-                    "1. Go to console.anthropic.com",
-                    "2. Sign up and verify email",
-                    "3. Navigate to API Keys",
-                    "4. Create a new key",
-                    "5. Add credits in Billing"
-                ],
-                "notes": "Paid only. High-quality responses."
-            },
-            {
-                "name": "Groq",
-                "color": ThemeManager.PROVIDER_COLORS["groq"],
-                "free": True,
-                "url": "https://console.groq.com/keys",
-                "steps": [
-                    "1. Go to console.groq.com",
-                    "2. Sign up for free",
-                    "3. Navigate to API Keys",
-                    "4. Create a new key",
-                    "5. No payment needed!"
-                ],
-                "notes": "Free tier available! Very fast."
-            }
-        ]
-
-        for prov in providers_info:
-            card = ctk.CTkFrame(scroll_frame, fg_color=self.theme.get("CARD_BG"), corner_radius=12)
+        for prov in _HELP_PROVIDERS:
+            card = self._themed(ctk.CTkFrame, scroll_frame, fg_color="CARD_BG", corner_radius=12)
             card.pack(fill="x", pady=(0, 12))
 
             # Header
@@ -1571,21 +1896,23 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             color_bar = ctk.CTkFrame(card_header, fg_color=prov["color"], width=4, height=24, corner_radius=2)
             color_bar.pack(side="left", padx=(0, 12))
 
-            name_label = ctk.CTkLabel(
+            name_label = self._themed(
+                ctk.CTkLabel,
                 card_header,
                 text=prov["name"],
-                font=ctk.CTkFont(size=15, weight="bold"),
-                text_color=self.theme.get("TEXT_PRIMARY")
+                font=_font(size=15, weight="bold"),
+                text_color="TEXT_PRIMARY"
             )
             name_label.pack(side="left")
 
             # Free/Paid badge
             badge_text = "FREE" if prov["free"] else "PAID"
-            badge_color = self.theme.get("SUCCESS") if prov["free"] else self.theme.get("WARNING")
-            badge = ctk.CTkLabel(
+            badge_color = "SUCCESS" if prov["free"] else "WARNING"
+            badge = self._themed(
+                ctk.CTkLabel,
                 card_header,
                 text=badge_text,
-                font=ctk.CTkFont(size=10, weight="bold"),
+                font=_font(size=10, weight="bold"),
                 text_color="#FFFFFF",
                 fg_color=badge_color,
                 corner_radius=4
@@ -1593,41 +1920,72 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             badge.pack(side="left", padx=10)
 
             # Get API Key button
-            get_key_btn = ctk.CTkButton(
+            get_key_btn = self._themed(
+                ctk.CTkButton,
                 card_header,
                 text="Get API Key",
                 width=90,
                 height=28,
-                font=ctk.CTkFont(size=11),
+                font=_font(size=11),
                 fg_color=prov["color"],
-                hover_color=self.theme.get("ACCENT_HOVER"),
+                hover_color="ACCENT_HOVER",
                 corner_radius=6,
-                command=lambda url=prov["url"]: webbrowser.open(url)
+                command=partial(webbrowser.open, prov["url"])
             )
             get_key_btn.pack(side="right")
 
-            # Steps
-            steps_frame = ctk.CTkFrame(card, fg_color=self.theme.get("INPUT_BG"), corner_radius=8)
-            steps_frame.pack(fill="x", padx=20, pady=(0, 8))
+            # Steps toggle
+            steps_btn = self._themed(
+                ctk.CTkButton,
+                card_header,
+                text="▸ Show steps",
+                width=100,
+                height=28,
+                font=_font(size=11),
+                fg_color="transparent",
+                text_color="TEXT_SECONDARY",
+                hover_color="BG_TERTIARY",
+                corner_radius=6
+            )
+            steps_btn.pack(side="right", padx=(0, 8))
+
+            # Notes
+            notes_label = self._themed(
+                ctk.CTkLabel,
+                card,
+                text=prov["notes"],
+                font=_font(size=11),
+                text_color="TEXT_MUTED"
+            )
+            notes_label.pack(padx=20, pady=(0, 16), anchor="w")
 
+            steps_btn.configure(command=partial(self._toggle_help_steps, prov, card, steps_btn, notes_label))
+
+        return scroll_frame
+
+    def _toggle_help_steps(self, prov: dict, card, button, notes_label):
+        """Show or hide a provider's setup steps on the help tab"""
+        steps_frame = self._help_steps.get(prov["name"])
+        if steps_frame is None:
+            steps_frame = self._themed(ctk.CTkFrame, card, fg_color="INPUT_BG", corner_radius=8)
             for step in prov["steps"]:
-                step_label = ctk.CTkLabel(
+                step_label = self._themed(
+                    ctk.CTkLabel,
                     steps_frame,
                     text=step,
-                    font=ctk.CTkFont(size=11),
-                    text_color=self.theme.get("TEXT_PRIMARY"),
+                    font=_font(size=11),
+                    text_color="TEXT_PRIMARY",
                     anchor="w"
                 )
                 step_label.pack(anchor="w", padx=12, pady=2)
+            self._help_steps[prov["name"]] = steps_frame
 
-            # Notes
-            notes_label = ctk.CTkLabel(
-                card,
-                text=prov["notes"],
-                font=ctk.CTkFont(size=11),
-                text_color=self.theme.get("TEXT_MUTED")
-            )
-            notes_label.pack(padx=20, pady=(0, 16), anchor="w")
+        if steps_frame.winfo_manager():
+            steps_frame.pack_forget()
+            button.configure(text="▸ Show steps")
+        else:
+            steps_frame.pack(fill="x", padx=20, pady=(0, 8), before=notes_label)
+            button.configure(text="▾ Hide steps")
 
     def on_file_drop(self, event):
         """Handle file drop"""
@@ -1650,13 +2008,13 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
 
     def load_file(self, file_path: str):
         """Load and extract text from file"""
-        if not os.path.exists(file_path):
-            messagebox.showerror("Error", "File not found")
+        # Reject by extension first; that needs no filesystem access
+        if not file_path.lower().endswith(('.pdf', '.docx', '.doc', '.txt')):
+            messagebox.showerror("Error", "Unsupported format. Use PDF, DOCX, or TXT.")
             return
 
-        ext = file_path.rsplit('.', 1)[-1].lower()
-        if ext not in ['pdf', 'docx', 'doc', 'txt']:
-            messagebox.showerror("Error", "Unsupported format. Use PDF, DOCX, or TXT.")
+        if not os.path.exists(file_path):
+            messagebox.showerror("Error", "File not found")
             return
 
         self.current_file_path = file_path
@@ -1665,38 +2023,38 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
 
         # Update drop zone to show loading state
         if hasattr(self, 'drop_content'):
-            for widget in self.drop_content.winfo_children():
-                widget.destroy()
-            loading_label = ctk.CTkLabel(
+            self._clear_drop_zone()
+            loading_label = self._themed(
+                ctk.CTkLabel,
                 self.drop_content,
                 text="Loading...",
-                font=ctk.CTkFont(size=14),
-                text_color=self.theme.get("TEXT_SECONDARY")
+                font=_font(size=14),
+                text_color="TEXT_SECONDARY"
             )
             loading_label.pack(pady=40)
-            self.update()
+            loading_label.update_idletasks()
 
         def extract():
             try:
                 text = self.extract_text(file_path, filename)
                 self.extracted_text = text
-                char_count = len(text)
-
                 # Update UI on main thread
-                def update_ui():
-                    if hasattr(self, '_show_loaded_file_drop_zone'):
-                        self._show_loaded_file_drop_zone(filename, char_count)
-
-                self.after(0, update_ui)
+                self.after_idle(self._on_file_loaded, filename, len(text))
             except Exception as e:
-                def show_error():
-                    messagebox.showerror("Error", f"Failed to load file: {str(e)}")
-                    if hasattr(self, '_show_empty_drop_zone'):
-                        self._show_empty_drop_zone()
+                self.after_idle(self._on_file_load_failed, str(e))
+
+        self._work_q.put(extract)
 
-                self.after(0, show_error)
+    def _on_file_loaded(self, filename: str, char_count: int):
+        """Show the loaded file in the drop zone"""
+        if hasattr(self, '_show_loaded_file_drop_zone'):
+            self._show_loaded_file_drop_zone(filename, char_count)
 
-        threading.Thread(target=extract, daemon=True).start()
+    def _on_file_load_failed(self, error: str):
+        """Report a failed file load and reset the drop zone"""
+        messagebox.showerror("Error", f"Failed to load file: {error}")
+        if hasattr(self, '_show_empty_drop_zone'):
+            self._show_empty_drop_zone()
 
     def extract_text(self, file_path: str, filename: str) -> str:
         """Extract text from document"""
@@ -1713,29 +2071,47 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
 
     def _extract_pdf(self, file_path: str) -> str:
         """Extract text from PDF"""
-        text = ""
+        parts = []
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except:
+            with _get_pdfplumber().open(file_path) as pdf:
+                page_count = len(pdf.pages)
+                if page_count < PDF_PARALLEL_MIN_PAGES:
+                    for page in pdf.pages:
+                        page_text = page.extract_text()
+                        if page_text:
+                            parts.append(page_text)
+
+            if page_count >= PDF_PARALLEL_MIN_PAGES:
+                # Each worker opens the file itself; map() returns the ranges in page order
+                starts, stops = zip(*_pdf_page_ranges(page_count))
+                for page_texts in _get_pdf_pool().map(_extract_pdf_page_range,
+                                                      [file_path] * len(starts), starts, stops):
+                    parts.extend(page_text for page_text in page_texts if page_text)
+        except Exception:
+            parts = []
             with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
+                reader = _get_pdf_reader().PdfReader(file)
                 for page in reader.pages:
-                    text += page.extract_text() + "\n"
-        return text.strip()
+                    page_text = page.extract_text()
+                    if page_text:
+                        parts.append(page_text)
+        return "\n".join(parts).strip()
 
     def _extract_docx(self, file_path: str) -> str:
         """Extract text from DOCX"""
-        doc = Document(file_path)
-        return '\n'.join([p.text for p in doc.paragraphs])
+        doc = _get_docx().Document(file_path)
+        parts = []
+        append = parts.append
+        for paragraph in doc.paragraphs:
+            text = paragraph.text
+            if text:
+                append(text)
+        return '\n'.join(parts)
 
     def summarize_document(self):
         """Summarize the document based on selected input mode"""
         # Get text based on selected input mode
-        input_mode = getattr(self, 'input_mode_var', ctk.StringVar(value="upload")).get()
+        input_mode = self.input_mode_var.get()
 
         if input_mode == "upload":
             # Use uploaded document
@@ -1759,29 +2135,28 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         model = self.api_manager.get_model(provider_name)
 
         self.summarize_btn.configure(state="disabled", text="Summarizing...")
-        self.update()
+        self.summarize_btn.update_idletasks()
 
         def do_summarize():
             try:
                 provider = get_provider(provider_name, api_key, model)
-                summary = provider.summarize(text)
-                self.current_summary = summary
-
-                # Switch to output tab and show summary
-                def show_result():
-                    self.summarize_btn.configure(state="normal", text="Summarize Document")
-                    self.switch_tab("output")
-                    messagebox.showinfo("Success", "Summary generated! View it in the Output tab.")
-
-                self.after(0, show_result)
+                self.current_summary = provider.summarize(text)
+                self.after_idle(self._on_summary_ready)
             except Exception as e:
-                def show_error():
-                    self.summarize_btn.configure(state="normal", text="Summarize Document")
-                    messagebox.showerror("Error", f"Failed to generate summary: {str(e)}")
+                self.after_idle(self._on_summary_failed, str(e))
 
-                self.after(0, show_error)
+        self._work_q.put(do_summarize)
 
-        threading.Thread(target=do_summarize, daemon=True).start()
+    def _on_summary_ready(self):
+        """Re-enable the summarize button and show the summary in the output tab"""
+        self.summarize_btn.configure(state="normal", text="Summarize Document")
+        self._rebuild_tab("output")
+        messagebox.showinfo("Success", "Summary generated! View it in the Output tab.")
+
+    def _on_summary_failed(self, error: str):
+        """Re-enable the summarize button and report the error"""
+        self.summarize_btn.configure(state="normal", text="Summarize Document")
+        messagebox.showerror("Error", f"Failed to generate summary: {error}")
 
     def export_summary(self):
         """Export summary to file"""
@@ -1789,9 +2164,9 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             return
 
         # Get export options
-        output_format = getattr(self, 'export_format_var', ctk.StringVar(value="pdf")).get()
-        style = getattr(self, 'export_style_var', ctk.StringVar(value="professional")).get()
-        color = getattr(self, 'export_color_var', ctk.StringVar(value="blue")).get()
+        output_format = self.export_format_var.get()
+        style = self.export_style_var.get()
+        color = self.export_color_var.get()
 
         ext = ".pdf" if output_format == "pdf" else ".docx"
         base = self.original_filename.rsplit('.', 1)[0]
@@ -1828,26 +2203,15 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         }
         return colors.get(color_name, colors["blue"])
 
-    def _create_pdf(self, summary: str, path: str, style: str = "professional", color: str = "blue"):
-        """Create styled PDF"""
-        from reportlab.lib.colors import HexColor, black, white
-        from reportlab.lib.units import inch
-        from reportlab.platypus import ListFlowable, ListItem, HRFlowable, Table, TableStyle
+    def _build_pdf_styles(self, color_scheme: dict):
+        """Build the PDF stylesheet for a color scheme"""
+        from reportlab.lib.colors import HexColor, black
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 
-        color_scheme = self._get_color_rgb(color)
         primary_color = HexColor(color_scheme["primary"])
         secondary_color = HexColor(color_scheme["secondary"])
         dark_color = HexColor(color_scheme["dark"])
 
-        doc = SimpleDocTemplate(
-            path,
-            pagesize=letter,
-            rightMargin=60,
-            leftMargin=60,
-            topMargin=50,
-            bottomMargin=40
-        )
-
         styles = getSampleStyleSheet()
 
         # Custom styles based on color scheme
@@ -1900,6 +2264,37 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             leading=16
         ))
 
+        styles.add(ParagraphStyle(
+            name='Footer',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=HexColor("#94A3B8"),
+            alignment=1  # Center
+        ))
+
+        return styles
+
+    def _create_pdf(self, summary: str, path: str, style: str = "professional", color: str = "blue"):
+        """Create styled PDF"""
+        from reportlab.lib.colors import HexColor
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        from reportlab.platypus import ListFlowable, ListItem, HRFlowable
+
+        styles = _STYLE_CACHE.get(color)
+        if styles is None:
+            styles = _STYLE_CACHE[color] = self._build_pdf_styles(self._get_color_rgb(color))
+        primary_color = styles['CustomTitle'].textColor
+
+        doc = SimpleDocTemplate(
+            path,
+            pagesize=letter,
+            rightMargin=60,
+            leftMargin=60,
+            topMargin=50,
+            bottomMargin=40
+        )
+
         elements = []
 
         # Title
@@ -1988,14 +2383,7 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         elements.append(HRFlowable(width="100%", thickness=1, color=HexColor("#E2E8F0")))
         elements.append(Spacer(1, 10))
 
-        footer_style = ParagraphStyle(
-            name='Footer',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=HexColor("#94A3B8"),
-            alignment=1  # Center
-        )
-        elements.append(Paragraph("Generated by Document Summarizer", footer_style))
+        elements.append(Paragraph("Generated by Document Summarizer", styles['Footer']))
 
         doc.build(elements)
 
@@ -2005,17 +2393,9 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
         from docx.enum.text import WD_ALIGN_PARAGRAPH
         from docx.enum.style import WD_STYLE_TYPE
 
-        color_map = {
-            "blue": RGBColor(37, 99, 235),
-            "green": RGBColor(5, 150, 105),
-            "purple": RGBColor(124, 58, 237),
-            "red": RGBColor(220, 38, 38),
-            "orange": RGBColor(234, 88, 12),
-            "gray": RGBColor(71, 85, 105),
-        }
-        accent_color = color_map.get(color, color_map["blue"])
+        accent_color = RGBColor(*_DOCX_ACCENT_RGB.get(color, _DOCX_ACCENT_RGB["blue"]))
 
-        doc = Document()
+        doc = _get_docx().Document()
 
         # Title
         title = doc.add_heading(f"Summary: {self.original_filename}", 0)
@@ -2097,7 +2477,7 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
     def _set_default(self, provider_name: str):
         """Set provider as default"""
         self.api_manager.set_default_provider(provider_name)
-        self.switch_tab("settings")
+        self._sync_provider_rows()
 
     def _remove_provider(self, provider_name: str):
         """Remove a provider"""
@@ -2106,7 +2486,7 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             if not self.api_manager.has_any_provider():
                 self.show_setup_view()
             else:
-                self.switch_tab("settings")
+                self._sync_provider_rows()
 
     def _add_provider(self):
         """Add a new provider"""
@@ -2117,18 +2497,21 @@ class DocumentSummarizerApp(TkinterDnD.Tk):
             messagebox.showwarning("Warning", "Please enter an API key")
             return
 
-        info = get_provider_info(provider)
+        info = self._provider_cache.get(provider)
         default_model = info['default_model'] if info else None
 
         try:
             self.api_manager.add_provider(provider, api_key, default_model, set_as_default=False)
-            self.switch_tab("settings")
+            self.new_api_key_entry.delete(0, "end")
+            self._sync_provider_rows()
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
 
 def main():
     """Main entry point"""
+    # Lets PDF extraction worker processes start from the frozen executable
+    multiprocessing.freeze_support()
     app = DocumentSummarizerApp()
     app.mainloop()
 
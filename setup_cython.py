@@ -0,0 +1,18 @@
+"""
+Optional build step: compile the hot shared modules with Cython
+Run `python setup_cython.py build_ext --inplace` before PyInstaller
+(build_windows.bat does this when CYTHONIZE=1)
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Only the modules on every summary's path: key lookups, token counting,
+# prompt building. app.py stays pure Python because Flask detects async
+# views with inspect.iscoroutinefunction, which does not recognize
+# Cython-compiled coroutines.
+MODULES = ["api_manager.py", "ai_providers.py"]
+
+setup(
+    name="document-summarizer-compiled",
+    ext_modules=cythonize(MODULES, language_level=3),
+)
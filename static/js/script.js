@@ -13,7 +13,7 @@ const summaryText = document.getElementById('summaryText');
 const errorText = document.getElementById('errorText');
 const downloadBtn = document.getElementById('downloadBtn');
 
-let currentDownloadFilename = '';
+let currentDownloadId = '';
 
 // File input change handler
 fileInput.addEventListener('change', (e) => {
@@ -94,6 +94,23 @@ form.addEventListener('submit', async (e) => {
         // Prepare form data
         const formData = new FormData(form);
 
+        // Stream the file as a raw body first so the server can write it straight to disk
+        if (hasFile) {
+            const file = fileInput.files[0];
+            const uploadResponse = await fetch(`/upload-stream?filename=${encodeURIComponent(file.name)}`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/octet-stream' },
+                body: file
+            });
+            const uploadData = await uploadResponse.json();
+            if (!uploadResponse.ok || !uploadData.success) {
+                showError(uploadData.error || 'Failed to upload the file.');
+                return;
+            }
+            formData.delete('file');
+            formData.set('upload_id', uploadData.upload_id);
+        }
+
         // Send request
         const response = await fetch('/summarize', {
             method: 'POST',
@@ -104,7 +121,7 @@ form.addEventListener('submit', async (e) => {
 
         if (response.ok && data.success) {
             // Show success result
-            showResult(data.summary, data.download_filename);
+            showResult(data.summary, data.download_id);
         } else {
             // Show error
             showError(data.error || 'An error occurred while summarizing the document.');
@@ -120,9 +137,9 @@ form.addEventListener('submit', async (e) => {
 });
 
 // Show result
-function showResult(summary, downloadFilename) {
+function showResult(summary, downloadId) {
     summaryText.textContent = summary;
-    currentDownloadFilename = downloadFilename;
+    currentDownloadId = downloadId;
     resultSection.style.display = 'block';
     resultSection.scrollIntoView({ behavior: 'smooth', block: 'start' });
 }
@@ -136,8 +153,8 @@ function showError(message) {
 
 // Download button handler
 downloadBtn.addEventListener('click', () => {
-    if (currentDownloadFilename) {
-        window.location.href = `/download/${currentDownloadFilename}`;
+    if (currentDownloadId) {
+        window.location.href = `/download/${currentDownloadId}`;
     }
 });
 
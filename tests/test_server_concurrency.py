@@ -0,0 +1,74 @@
+"""
+Concurrency check for the desktop launcher's server backends
+
+A long /summarize must not block the other requests, so every installed backend
+has to serve concurrent requests in parallel. Run with:
+    python -m unittest discover tests
+"""
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import desktop_launcher
+
+REQUEST_SECONDS = 1.0
+CONCURRENT_REQUESTS = 4
+
+
+def slow_app(environ, start_response):
+    """WSGI app whose every request takes REQUEST_SECONDS"""
+    time.sleep(REQUEST_SECONDS)
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [b'ok']
+
+
+class ServerConcurrencyTest(unittest.TestCase):
+
+    def check_backend(self, name):
+        sock = socket.create_server(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        try:
+            server = desktop_launcher.create_server(slow_app, sock, backend=name)
+        except ImportError:
+            sock.close()
+            self.skipTest(f"{name} is not installed")
+        thread = threading.Thread(target=server.serve, daemon=True)
+        thread.start()
+        try:
+            url = f'http://127.0.0.1:{port}/'
+            start = time.monotonic()
+            with ThreadPoolExecutor(CONCURRENT_REQUESTS) as pool:
+                bodies = list(pool.map(lambda _: urllib.request.urlopen(url, timeout=30).read(),
+                                       range(CONCURRENT_REQUESTS)))
+            elapsed = time.monotonic() - start
+        finally:
+            server.stop()
+            thread.join(timeout=10)
+            sock.close()
+        self.assertEqual(bodies, [b'ok'] * CONCURRENT_REQUESTS)
+        # Serialized requests would take CONCURRENT_REQUESTS * REQUEST_SECONDS
+        self.assertLess(elapsed, 2 * REQUEST_SECONDS,
+                        f"{name} served {CONCURRENT_REQUESTS} requests one at a time")
+
+    def test_waitress(self):
+        self.check_backend('waitress')
+
+    def test_werkzeug(self):
+        self.check_backend('werkzeug')
+
+    def test_uvicorn(self):
+        self.check_backend('uvicorn')
+
+    def test_gevent(self):
+        self.check_backend('gevent')
+
+
+if __name__ == '__main__':
+    unittest.main()